@@ -81,6 +81,14 @@ class SwapRequest(BaseModel):
     pos_b: int
 
 
+class InsertLinesRequest(BaseModel):
+    count: int
+
+
+class DeleteLinesRequest(BaseModel):
+    positions: list[int]
+
+
 # ------------------------------------------------------------------
 # Endpoints
 # ------------------------------------------------------------------
@@ -178,6 +186,28 @@ def insert_line(doc_id: str, position: int):
         raise HTTPException(422, str(e))
 
 
+@router.post("/documents/{doc_id}/lines/{position}/insert-many")
+def insert_lines(doc_id: str, position: int, req: InsertLinesRequest):
+    """Insert *count* blank lines at the given 0-based position (one undo step)."""
+    try:
+        return svc().insert_blank_lines(doc_id, position, req.count)
+    except (KeyError, IndexError):
+        raise HTTPException(404, "Document or line not found")
+    except Exception as e:
+        raise HTTPException(422, str(e))
+
+
+@router.post("/documents/{doc_id}/lines/delete")
+def delete_lines(doc_id: str, req: DeleteLinesRequest):
+    """Delete several lines by 0-based position (one undo step)."""
+    try:
+        return svc().delete_lines(doc_id, req.positions)
+    except (KeyError, IndexError):
+        raise HTTPException(404, "Document or line not found")
+    except Exception as e:
+        raise HTTPException(422, str(e))
+
+
 @router.post("/documents/{doc_id}/lines/{position}/toggle-comment")
 def toggle_comment(doc_id: str, position: int):
     """Toggle the comment state of a line (comment ↔ uncomment)."""
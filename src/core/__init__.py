@@ -2,7 +2,7 @@ from core.document_type import DocumentType
 from core.line_status import LineStatus
 from core.validation_result import ValidationResult
 from core.document_line import DocumentLine
-from core.document import Document, MutationRecord
+from core.document import Document, MutationRecord, SwapRecord
 from core.interfaces import (
     HasNetSpecs,
     INetlistQueryService,
@@ -20,6 +20,7 @@ __all__ = [
     "HasNetSpecs",
     "Document",
     "MutationRecord",
+    "SwapRecord",
     "INetlistQueryService",
     "IEditController",
     "IEditSessionState",
@@ -8,6 +8,10 @@ close-to-O(1) lookups:
 - ``_line_nets[line_id]``  → frozenset of canonical net names
 - ``_net_lines[net_name]`` → set of line_ids that cover that net
 
+plus ``_shared_nets``, the set of nets currently owned by more than one
+line, so the common "is this line clean?" query is a single
+``isdisjoint`` call instead of one reverse-index probe per net.
+
 ConflictDetector owns a ConflictStore and an NQS reference.
 It supports efficient incremental updates:
 
@@ -21,8 +25,11 @@ It supports efficient incremental updates:
 * **Remove line X** — call ``store.remove_line(X)`` which cleans up
   both indexes.  No full scan required.
 
-A full rebuild via :meth:`ConflictDetector.rebuild` is used only on
-initial document load to populate the store in a single batch pass.
+A full rebuild via :meth:`ConflictDetector.rebuild` drops the cached
+resolutions and populates the store in a single batch pass.  Rebuilding
+a detector that already holds state for the same lines (e.g. after the
+netlist is reloaded) diffs the freshly resolved nets against the store
+and only touches lines whose nets actually changed.
 
 Usage::
 
@@ -38,8 +45,9 @@ Usage::
 from __future__ import annotations
 
 import logging
+import sys
 from dataclasses import dataclass
-from functools import lru_cache
+from functools import cached_property
 from typing import Optional, TYPE_CHECKING
 
 logger = logging.getLogger(__name__)
@@ -50,6 +58,8 @@ if TYPE_CHECKING:
 
 __all__ = ["ConflictStore", "ConflictInfo", "ConflictDetector"]
 
+_EMPTY: frozenset[str] = frozenset()
+
 
 class ConflictStore:
     """
@@ -57,13 +67,19 @@ class ConflictStore:
     relationships and exposes efficient conflict queries.
     """
 
-    __slots__ = ("_line_nets", "_net_lines")
+    __slots__ = ("_line_nets", "_net_lines", "_shared_nets", "_version", "_info_cache")
 
     def __init__(self) -> None:
         # line_id → frozenset of canonical net names (strings)
         self._line_nets: dict[str, frozenset[str]] = {}
         # canonical_net_name → set of line_ids
         self._net_lines: dict[str, set[str]] = {}
+        # canonical_net_name of every net owned by two or more lines
+        self._shared_nets: set[str] = set()
+        # Bumped on every mutation; invalidates ``_info_cache`` entries.
+        self._version = 0
+        # line_id → (version, ConflictInfo | None) from the last query
+        self._info_cache: dict[str, tuple[int, Optional[ConflictInfo]]] = {}
 
     # ------------------------------------------------------------------
     # Mutations
@@ -76,17 +92,22 @@ class ConflictStore:
         If the line already existed, its old nets are first removed from
         the reverse index, then the new nets are inserted.
         """
+        self._version += 1
         self._remove_line_from_index(line_id)
 
-        new_nets = frozenset(nets)
+        new_nets = nets if type(nets) is frozenset else frozenset(nets)
         if not new_nets:
             # No nets — line doesn't participate in conflicts.
             self._line_nets.pop(line_id, None)
             return
 
         self._line_nets[line_id] = new_nets
+        shared = self._shared_nets
         for net in new_nets:
-            self._net_lines.setdefault(net, set()).add(line_id)
+            owners = self._net_lines.setdefault(net, set())
+            owners.add(line_id)
+            if len(owners) > 1:
+                shared.add(net)
 
     def build_from_lines(self, line_nets: dict[str, frozenset[str]]) -> None:
         """
@@ -96,48 +117,90 @@ class ConflictStore:
         rebuild because it skips the per-line ``_remove_line_from_index``
         overhead — both indexes start empty.
         """
+        self._version += 1
+        self._info_cache.clear()
         self._line_nets = {lid: nets for lid, nets in line_nets.items() if nets}
         net_lines: dict[str, set[str]] = {}
+        get_owners = net_lines.get
         for line_id, nets in self._line_nets.items():
             for net in nets:
-                net_lines.setdefault(net, set()).add(line_id)
+                owners = get_owners(net)
+                if owners is None:
+                    net_lines[net] = {line_id}
+                else:
+                    owners.add(line_id)
         self._net_lines = net_lines
+        self._shared_nets = {net for net, owners in net_lines.items() if len(owners) > 1}
+
+    def sync_from_lines(self, line_nets: dict[str, frozenset[str]]) -> int:
+        """
+        Bring the store in line with *line_nets* incrementally.
+
+        Lines missing from *line_nets* are removed and lines whose nets
+        differ are re-indexed; unchanged lines are left alone.  Returns
+        the number of lines that were added, changed or removed.
+
+        When no line survives (a reloaded document gets fresh line ids)
+        there is nothing to keep, so the store is batch-built instead.
+        """
+        old = self._line_nets
+        if old.keys().isdisjoint(line_nets):
+            changed = len(old) + len(line_nets)
+            self.build_from_lines(line_nets)
+            return changed
+        stale = old.keys() - line_nets.keys()
+        for line_id in stale:
+            self.remove_line(line_id)
+        changed = len(stale)
+        for line_id, nets in line_nets.items():
+            if old.get(line_id, _EMPTY) != nets:
+                self.update_line(line_id, nets)
+                changed += 1
+        return changed
 
     def remove_line(self, line_id: str) -> None:
         """Remove a line and clean up both indexes."""
+        self._version += 1
         self._remove_line_from_index(line_id)
         self._line_nets.pop(line_id, None)
+        self._info_cache.pop(line_id, None)
 
     def clear(self) -> None:
         """Reset the entire store."""
+        self._version += 1
         self._line_nets.clear()
         self._net_lines.clear()
+        self._shared_nets.clear()
+        self._info_cache.clear()
 
     # ------------------------------------------------------------------
     # Queries (all close to O(1) for typical data)
     # ------------------------------------------------------------------
 
+    def __len__(self) -> int:
+        """Number of lines that currently own at least one net."""
+        return len(self._line_nets)
+
     def is_conflicting(self, line_id: str) -> bool:
         """Return True if *line_id* shares at least one net with another line."""
         nets = self._line_nets.get(line_id)
         if not nets:
             return False
-        for net in nets:
-            owners = self._net_lines.get(net)
-            if owners and len(owners) > 1:
-                return True
-        return False
+        return not nets.isdisjoint(self._shared_nets)
 
     def get_conflicting_lines(self, line_id: str) -> set[str]:
         """Return the set of other line_ids that share nets with *line_id*."""
         nets = self._line_nets.get(line_id)
-        if not nets:
+        if not nets or nets.isdisjoint(self._shared_nets):
+            # Clean line (the common case): no accumulator needed.
             return set()
-        result: set[str] = set()
-        for net in nets:
-            owners = self._net_lines.get(net)
-            if owners:
-                result.update(owners)
+        # Only shared nets can contribute peers.  Merge their owner sets
+        # in one union call, smallest first, instead of growing the
+        # result through repeated update() calls.
+        net_lines = self._net_lines
+        buckets = [net_lines[net] for net in nets & self._shared_nets]
+        buckets.sort(key=len)
+        result = set().union(*buckets)
         result.discard(line_id)
         return result
 
@@ -146,12 +209,7 @@ class ConflictStore:
         nets = self._line_nets.get(line_id)
         if not nets:
             return frozenset()
-        result: set[str] = set()
-        for net in nets:
-            owners = self._net_lines.get(net)
-            if owners and len(owners) > 1:
-                result.add(net)
-        return frozenset(result)
+        return nets & self._shared_nets
 
     def get_per_line_conflicts(self, line_id: str) -> dict[str, frozenset[str]]:
         """Return a mapping of peer_line_id → frozenset of shared nets.
@@ -176,11 +234,18 @@ class ConflictStore:
         """
         Return a :class:`ConflictInfo` for *line_id*, or ``None`` if the
         line is not in conflict.
+
+        Results are memoised until the next mutation of the store, so
+        repeated queries for the same line (e.g. re-rendering a page)
+        return the same immutable object without rebuilding it.
         """
+        cached = self._info_cache.get(line_id)
+        if cached is not None and cached[0] == self._version:
+            return cached[1]
         per_line = self.get_per_line_conflicts(line_id)
-        if not per_line:
-            return None
-        return ConflictInfo(peers=per_line)
+        info = ConflictInfo(peers=per_line) if per_line else None
+        self._info_cache[line_id] = (self._version, info)
+        return info
 
     # ------------------------------------------------------------------
     # Internals
@@ -195,8 +260,10 @@ class ConflictStore:
             owners = self._net_lines.get(net)
             if owners:
                 owners.discard(line_id)
-                if not owners:
-                    del self._net_lines[net]
+                if len(owners) < 2:
+                    self._shared_nets.discard(net)
+                    if not owners:
+                        del self._net_lines[net]
 
 
 @dataclass(frozen=True)
@@ -207,21 +274,21 @@ class ConflictInfo:
     canonical net names shared between *this* line and that peer.
     This enables the UI to display per-conflict-line detail, e.g.
     "conflicts with line 3 on {a, b} and line 4 on {c}".
+
+    The derived sets are computed on first access and then kept, so a
+    memoised instance pays for each of them at most once.
     """
     peers: dict[str, frozenset[str]]
 
-    @property
+    @cached_property
     def conflicting_line_ids(self) -> frozenset[str]:
         """All peer line_ids (convenience shortcut)."""
         return frozenset(self.peers)
 
-    @property
+    @cached_property
     def shared_net_ids(self) -> frozenset[str]:
         """Union of all shared nets across all peers."""
-        result: set[str] = set()
-        for nets in self.peers.values():
-            result.update(nets)
-        return frozenset(result)
+        return _EMPTY.union(*self.peers.values())
 
 
 # ------------------------------------------------------------------
@@ -256,7 +323,10 @@ class ConflictDetector:
     * **Insert new line X**: no-op (new lines are always empty)
     * **Remove line X**: call ``remove_line(line_id)`` — O(|old_nets_of_X|)
 
-    A full :meth:`rebuild` is used only on initial document load.
+    :meth:`rebuild` batch-builds the store on initial document load and
+    falls back to :meth:`rebuild_diff` once the store holds state.  Both
+    drop every cached resolution first, so a reloaded netlist is never
+    answered from stale entries.
 
     Performance
     -----------
@@ -265,7 +335,9 @@ class ConflictDetector:
       through the hierarchy exactly once for the lifetime of the detector.
     * ``resolve_to_canonical_names`` has a fast path for the common case
       (exact template, exact net, no regex/bus): pure in-memory lookups
-      with no SQL involved.
+      with no SQL involved.  Its results are kept in an unbounded
+      per-detector dict keyed on the *normalised* pattern, so ``Vdd``
+      and ``vdd`` share one entry.
     * Full rebuilds use :meth:`ConflictStore.build_from_lines` to
       construct both indexes in a single batch pass.
     """
@@ -274,12 +346,17 @@ class ConflictDetector:
         self._nqs = nqs
         self._store = ConflictStore()
         self._top_cell = nqs.get_top_cell()
+        # (tpl_name, net_norm, template_regex, net_regex) → resolved names
+        self._resolved: dict[tuple[str, str, bool, bool], frozenset[str]] = {}
+        # (template, canonical_net) → top-cell names
+        self._top_names: dict[tuple[str, str], frozenset[str]] = {}
+        # (template pattern, template_regex) → matching templates
+        self._templates: dict[tuple[Optional[str], bool], frozenset[str]] = {}
 
     # ------------------------------------------------------------------
     # Hierarchy cache — resolved lazily, never evicted
     # ------------------------------------------------------------------
 
-    @lru_cache(maxsize=4096)
     def _resolve_tpl_net_to_top_names(self, tpl: str, net: str) -> frozenset[str]:
         """
         Map a single (template, canonical_net) to top-cell net names.
@@ -287,14 +364,49 @@ class ConflictDetector:
         Uses ``find_net_instance_names`` to walk the hierarchy, then
         returns the resulting top-cell names.  Cached with no size limit
         so each pair is resolved at most once.
+
+        Names are interned so that every line and cache entry covering
+        the same net shares one string object: the store's indexes hold
+        each name once, and dict/set probes short-circuit on identity.
+        A frozenset from NQS is trusted to be interned already and kept
+        as-is; any other collection is copied once.
         """
-        return frozenset(self._nqs.find_net_instance_names(tpl, net))
+        key = (tpl, net)
+        names = self._top_names.get(key)
+        if names is None:
+            names = self._nqs.find_net_instance_names(tpl, net)
+            if type(names) is not frozenset:
+                names = frozenset(map(sys.intern, names))
+            self._top_names[key] = names
+        return names
+
+    def _matching_templates(
+        self, template: Optional[str], template_regex: bool,
+    ) -> frozenset[str]:
+        """
+        Return the templates matched by a spec's template pattern.
+
+        ``None`` means the top cell; exact names are compared
+        case-insensitively.  Cached so that every spec naming the same
+        template (e.g. all nets of one mutex line) pays for the NQS
+        lookup once, and an unknown template is rejected in O(1).
+        """
+        key = (template, template_regex)
+        templates = self._templates.get(key)
+        if templates is None:
+            tpl_name = template or self._top_cell
+            if not template_regex:
+                tpl_name = tpl_name.lower()
+            templates = frozenset(
+                self._nqs.get_matching_templates(tpl_name, template_regex)
+            )
+            self._templates[key] = templates
+        return templates
 
     # ------------------------------------------------------------------
     # Resolution — pattern → frozenset[str]
     # ------------------------------------------------------------------
 
-    @lru_cache(maxsize=512)
     def resolve_to_canonical_names(
         self,
         template: Optional[str],
@@ -313,18 +425,40 @@ class ConflictDetector:
         Slow path (regex / bus notation):
             Uses ``find_matches`` for pattern expansion, then maps
             each result through the hierarchy cache.
+
+        Results are cached per detector after case normalisation and
+        never evicted: the number of distinct patterns in a document
+        bounds the cache.
         """
         if not net_name:
-            return frozenset()
+            return _EMPTY
 
-        nqs = self._nqs
         tpl_name = (template or self._top_cell)
         tpl_name = tpl_name.lower() if not template_regex else tpl_name
         net_norm = net_name.lower() if not net_regex else net_name
 
-        matching_templates = nqs.get_matching_templates(tpl_name, template_regex)
+        key = (tpl_name, net_norm, template_regex, net_regex)
+        names = self._resolved.get(key)
+        if names is None:
+            names = self._resolve_uncached(
+                template, tpl_name, net_norm, template_regex, net_regex,
+            )
+            self._resolved[key] = names
+        return names
+
+    def _resolve_uncached(
+        self,
+        template: Optional[str],
+        tpl_name: str,
+        net_norm: str,
+        template_regex: bool,
+        net_regex: bool,
+    ) -> frozenset[str]:
+        """Body of :meth:`resolve_to_canonical_names` for normalised input."""
+        nqs = self._nqs
+        matching_templates = self._matching_templates(template, template_regex)
         if not matching_templates:
-            return frozenset()
+            return _EMPTY
 
         result_names: set[str] = set()
 
@@ -361,16 +495,23 @@ class ConflictDetector:
         Resolve the set of top-cell canonical net names that a line's
         data covers.
 
-        *data* must expose a ``net_specs()`` method returning a list of
-        :class:`NetSpec` instances.  Returns a frozenset of canonical
-        net name strings.
+        *data* must implement :class:`HasNetSpecs`.  Returns a frozenset
+        of canonical net name strings.
+
+        Dispatch is polymorphic through ``net_specs()``; a single-spec
+        line (every AF line) returns the cached resolution directly, so
+        lines naming the same pattern share one frozenset.
         """
-        specs = getattr(data, "net_specs", None)
-        if specs is None:
-            return frozenset()
+        specs = data.net_specs()
+        if len(specs) == 1:
+            spec = specs[0]
+            return self.resolve_to_canonical_names(
+                spec.template, spec.net,
+                spec.is_template_regex, spec.is_net_regex,
+            )
 
         all_names: set[str] = set()
-        for spec in specs():
+        for spec in specs:
             all_names.update(
                 self.resolve_to_canonical_names(
                     spec.template, spec.net,
@@ -380,32 +521,62 @@ class ConflictDetector:
         return frozenset(all_names)
 
     # ------------------------------------------------------------------
-    # Full rebuild (initial load only)
+    # Full rebuild
     # ------------------------------------------------------------------
 
     def rebuild(self, lines: list["DocumentLine"]) -> None:
         """
-        Rebuild conflict state from scratch for all *lines*.
+        Rebuild conflict state for all *lines*.
+
+        On an empty store (initial document load) this uses
+        :meth:`ConflictStore.build_from_lines` for a single-pass batch
+        build with no per-line remove-from-index overhead.  Otherwise it
+        delegates to :meth:`rebuild_diff`.  After that, the incremental
+        :meth:`update_line` and :meth:`remove_line` methods keep the
+        index consistent without scanning all lines.
+        """
+        if len(self._store):
+            self.rebuild_diff(lines)
+            return
+        self._clear_caches()
+        line_nets = self._resolve_all(lines)
+        self._store.build_from_lines(line_nets)
+        logger.debug(
+            "Conflict index rebuilt: %d lines with nets, %d unique nets",
+            len(line_nets),
+            sum(len(nets) for nets in line_nets.values()),
+        )
 
-        Used **only** during initial document load.  After that, the
-        incremental :meth:`update_line` and :meth:`remove_line` methods
-        keep the index consistent without scanning all lines.
+    def rebuild_diff(self, lines: list["DocumentLine"]) -> None:
+        """
+        Re-resolve all *lines* and apply only the differences to the store.
 
-        Uses :meth:`ConflictStore.build_from_lines` for a single-pass
-        batch build (no per-line remove-from-index overhead).
+        Lines whose nets are unchanged keep their index entries, so the
+        cost of updating the store is proportional to the number of
+        changed lines rather than the document size.  Cached resolutions
+        are dropped first so every line is resolved against the current
+        netlist.
         """
+        self._clear_caches()
+        changed = self._store.sync_from_lines(self._resolve_all(lines))
+        logger.debug("Conflict index diffed: %d lines changed", changed)
+
+    def _clear_caches(self) -> None:
+        """Forget every cached resolution and re-read the top cell."""
+        self._top_cell = self._nqs.get_top_cell()
+        self._resolved.clear()
+        self._top_names.clear()
+        self._templates.clear()
+
+    def _resolve_all(self, lines: list["DocumentLine"]) -> dict[str, frozenset[str]]:
+        """Map every line with data to its non-empty resolved net set."""
         line_nets: dict[str, frozenset[str]] = {}
         for line in lines:
             if line.data is not None:
                 nets = self.resolve_line_nets(line.data)
                 if nets:
                     line_nets[line.line_id] = nets
-        self._store.build_from_lines(line_nets)
-        logger.debug(
-            "Conflict index rebuilt: %d lines with nets, %d unique nets",
-            len(line_nets),
-            sum(len(nets) for nets in line_nets.values()),
-        )
+        return line_nets
 
     # ------------------------------------------------------------------
     # Incremental updates
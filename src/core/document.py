@@ -8,41 +8,106 @@ file.  It is the source of truth for:
 - The edit services      → read a line (by id) into a controller, write it back
 - The persistence layer  → serialize all lines back to disk
 
-Lines are addressed by stable UUID (``line_id``) internally for O(1)
+Lines are addressed by a stable id (``line_id``) internally for O(1)
 lookups and conflict tracking.  The API layer resolves 0-based positions
 to ``line_id`` at the service boundary, so callers outside the backend
-never see UUIDs.
+never see line ids.
 """
 from __future__ import annotations
 
 import logging
-from typing import Optional
+from collections import deque
+from collections.abc import Iterable, Iterator, Sequence
+from operator import attrgetter
+from typing import Optional, overload
 
 from core.document_commands import (
     Command,
+    InsertBlockCmd,
     InsertCmd,
     MutationRecord,
+    RemoveBlockCmd,
     RemoveCmd,
     ReplaceCmd,
     SwapCmd,
+    SwapRecord,
 )
 from core.document_type import DocumentType
-from core.document_line import DocumentLine
+from core.document_line import DocumentLine, LineId
 
 logger = logging.getLogger(__name__)
 
+_line_id_of = attrgetter("line_id")
+
+
+def _clamp_insert_position(position: int, n: int) -> int:
+    """Resolve *position* like ``list.insert`` does for a list of length *n*."""
+    if position < 0:
+        return max(0, position + n)
+    if position > n:
+        return n
+    return position
+
+# Default number of undoable steps kept per document.  Older steps are
+# dropped so a long session does not keep every historic line alive.
+UNDO_LIMIT = 500
+
+
+class _LinesView(Sequence[DocumentLine]):
+    """Read-only, zero-copy view over a document's lines.
+
+    The view is live: it always reflects the document's current
+    contents.  Slicing returns a new list, so callers never get a
+    handle on the document's internal storage.
+    """
+
+    __slots__ = ("_doc",)
+
+    def __init__(self, doc: Document) -> None:
+        self._doc = doc
+
+    def __len__(self) -> int:
+        return len(self._doc._lines)
+
+    @overload
+    def __getitem__(self, index: int) -> DocumentLine: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[DocumentLine]: ...
+
+    def __getitem__(self, index):
+        return self._doc._lines[index]
+
+    def __iter__(self) -> Iterator[DocumentLine]:
+        return iter(self._doc._lines)
+
+    def __repr__(self) -> str:
+        return f"<lines view of {len(self)} lines>"
+
 
 class Document:
     """
     Mutable ordered collection of :class:`DocumentLine` objects.
 
-    Internal invariant: ``_index[line.line_id] == position`` for every
-    line.  The index is maintained incrementally on insert / remove /
-    replace.  Updates that only change ``data`` or ``status`` inside an
+    Internal invariant: ``_index`` holds a key for every line, and for
+    every line at a position below the ``_dirty_from`` watermark the
+    stored value is exact.  Structural mutations only stamp the lines
+    they add and lower the watermark instead of renumbering the shifted
+    suffix; every other line keeps a stored value ``>= _dirty_from``.
+    A lookup that lands on or above the watermark re-stamps the suffix
+    once (:meth:`_reconcile`), so a run of inserts pays for a single
+    renumber.  Updates that only change ``data`` or ``status`` inside an
     existing ``DocumentLine`` do *not* need an index update.
+
+    ``_line_ids`` mirrors ``_lines`` position for position
+    (``_line_ids[i] == _lines[i].line_id``), so index maintenance walks a
+    flat list of ids instead of dereferencing every ``DocumentLine``.
+    ``_lines_by_id`` maps each id straight to its line, so
+    :meth:`get_line` is one dict probe that never needs a reconcile.
     """
 
-    __slots__ = ("doc_type", "file_path", "_lines", "_index", "_lines_cache",
+    __slots__ = ("doc_type", "file_path", "_lines", "_line_ids", "_index",
+                 "_lines_by_id", "_dirty_from", "_lines_view",
                  "_undo_stack", "_redo_stack")
 
     def __init__(
@@ -50,14 +115,18 @@ class Document:
         doc_type: DocumentType,
         file_path: str = "",
         lines: Optional[list[DocumentLine]] = None,
+        undo_limit: int = UNDO_LIMIT,
     ):
         self.doc_type: DocumentType = doc_type
         self.file_path: str = file_path
         self._lines: list[DocumentLine] = list(lines) if lines else []
-        self._index: dict[str, int] = {}
-        self._lines_cache: tuple[DocumentLine, ...] | None = None
-        self._undo_stack: list[Command] = []
-        self._redo_stack: list[Command] = []
+        self._line_ids: list[LineId] = list(map(_line_id_of, self._lines))
+        self._index: dict[LineId, int] = {}
+        self._lines_by_id: dict[LineId, DocumentLine] = {}
+        self._dirty_from = 0
+        self._lines_view = _LinesView(self)
+        self._undo_stack: deque[Command] = deque(maxlen=undo_limit)
+        self._redo_stack: deque[Command] = deque(maxlen=undo_limit)
         self._rebuild_index()
 
     # ------------------------------------------------------------------
@@ -65,11 +134,9 @@ class Document:
     # ------------------------------------------------------------------
 
     @property
-    def lines(self) -> tuple[DocumentLine, ...]:
-        """Return a cached tuple so callers cannot break internal ordering."""
-        if self._lines_cache is None:
-            self._lines_cache = tuple(self._lines)
-        return self._lines_cache
+    def lines(self) -> Sequence[DocumentLine]:
+        """Return a read-only live view so callers cannot break internal ordering."""
+        return self._lines_view
 
     def __len__(self) -> int:
         return len(self._lines)
@@ -77,16 +144,18 @@ class Document:
     def __getitem__(self, position: int) -> DocumentLine:
         return self._lines[position]
 
-    def get_line(self, line_id: str) -> DocumentLine:
-        """Fetch a line by its stable UUID.  Raises KeyError if not found."""
-        pos = self._index[line_id]
-        return self._lines[pos]
+    def __iter__(self) -> Iterator[DocumentLine]:
+        return iter(self._lines)
+
+    def get_line(self, line_id: LineId) -> DocumentLine:
+        """Fetch a line by its stable id.  Raises KeyError if not found."""
+        return self._lines_by_id[line_id]
 
-    def get_position(self, line_id: str) -> int:
+    def get_position(self, line_id: LineId) -> int:
         """Return the 0-based position of a line.  Raises KeyError."""
-        return self._index[line_id]
+        return self._position_of(line_id)
 
-    def has_line(self, line_id: str) -> bool:
+    def has_line(self, line_id: LineId) -> bool:
         return line_id in self._index
 
     # ------------------------------------------------------------------
@@ -95,24 +164,48 @@ class Document:
 
     def insert_line(self, position: int, line: DocumentLine) -> None:
         """Insert *line* at *position*.  Recorded for undo."""
-        self._apply_insert_line(position, line)
-        self._undo_stack.append(InsertCmd(position, line))
-        self._redo_stack.clear()
+        position = self._apply_insert_line(position, line)
+        self._record(InsertCmd.acquire(position, line))
 
-    def remove_line(self, line_id: str) -> DocumentLine:
-        """Remove and return a line by UUID.  Recorded for undo."""
+    def remove_line(self, line_id: LineId) -> DocumentLine:
+        """Remove and return a line by id.  Recorded for undo."""
         pos = self.get_position(line_id)
         removed = self._apply_remove_line(line_id)
-        self._undo_stack.append(RemoveCmd(pos, removed))
-        self._redo_stack.clear()
+        self._record(RemoveCmd.acquire(pos, removed))
         return removed
 
-    def replace_line(self, line_id: str, new_line: DocumentLine) -> None:
+    def insert_lines(self, position: int, lines: Iterable[DocumentLine]) -> None:
+        """Insert *lines* as a block starting at *position*.
+
+        The whole block is spliced in at once, the shifted suffix is
+        re-indexed once, and a single undo step is recorded.  *position*
+        is resolved like :meth:`insert_line` (negative positions count
+        from the end, out-of-range positions clamp).  Raises
+        ``ValueError`` on duplicate line_ids.
+        """
+        block = tuple(lines)
+        if not block:
+            return
+        position = self._apply_insert_lines(position, block)
+        self._record(InsertBlockCmd(position, block))
+
+    def remove_lines(self, line_ids: Iterable[LineId]) -> list[DocumentLine]:
+        """Remove several lines by id as a single undo step.
+
+        Returns the removed lines in document order.  Raises
+        ``KeyError`` (before mutating anything) if an id is unknown.
+        """
+        removed = self._apply_remove_lines(list(line_ids))
+        if not removed:
+            return []
+        self._record(RemoveBlockCmd(removed))
+        return [line for _, line in removed]
+
+    def replace_line(self, line_id: LineId, new_line: DocumentLine) -> None:
         """Replace a line in-place.  Recorded for undo."""
-        old_line = self.get_line(line_id)
-        self._apply_replace_line(line_id, new_line)
-        self._undo_stack.append(ReplaceCmd(old_line, new_line))
-        self._redo_stack.clear()
+        old_line = self._lines_by_id[line_id]
+        pos = self._apply_replace_line(line_id, new_line)
+        self._record(ReplaceCmd.acquire(pos, old_line, new_line))
 
     def swap_lines(self, pos_a: int, pos_b: int) -> None:
         """Swap two lines by position.  Recorded for undo.
@@ -123,8 +216,9 @@ class Document:
         if pos_a == pos_b:
             raise ValueError("Cannot swap a line with itself")
         self._apply_swap_lines(pos_a, pos_b)
-        self._undo_stack.append(SwapCmd(pos_a, pos_b))
-        self._redo_stack.clear()
+        ids = self._line_ids
+        # After the swap, pos_b holds the line that was at pos_a.
+        self._record(SwapCmd.acquire(pos_a, pos_b, ids[pos_b], ids[pos_a]))
 
     # ------------------------------------------------------------------
     # Undo / Redo
@@ -140,92 +234,260 @@ class Document:
         """``True`` if there is at least one operation to redo."""
         return bool(self._redo_stack)
 
-    def undo(self) -> MutationRecord | None:
+    def undo(self) -> MutationRecord | SwapRecord | None:
         """Undo the most recent mutation.
 
-        Returns a :class:`MutationRecord` describing the *applied*
-        reversal (e.g. undoing an insert returns a ``"remove"`` record),
-        or ``None`` if the undo stack is empty.
+        Returns a :class:`MutationRecord` (:class:`SwapRecord` for
+        swaps) describing the *applied* reversal (e.g. undoing an
+        insert returns a ``"remove"`` record), or ``None`` if the undo
+        stack is empty.
         """
         if not self._undo_stack:
             return None
         cmd = self._undo_stack.pop()
         record = cmd.undo(self)
         self._redo_stack.append(cmd)
-        logger.debug("Undo: %s line %s at position %d",
-                     record.kind, record.line_id, record.position)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Undo: %s line %s at position %d",
+                         record.kind, record.line_id, record.position)
         return record
 
-    def redo(self) -> MutationRecord | None:
+    def redo(self) -> MutationRecord | SwapRecord | None:
         """Redo the most recently undone mutation.
 
-        Returns a :class:`MutationRecord` describing the *applied*
-        mutation, or ``None`` if the redo stack is empty.
+        Returns a :class:`MutationRecord` (:class:`SwapRecord` for
+        swaps) describing the *applied* mutation, or ``None`` if the
+        redo stack is empty.
         """
         if not self._redo_stack:
             return None
         cmd = self._redo_stack.pop()
         record = cmd.redo(self)
         self._undo_stack.append(cmd)
-        logger.debug("Redo: %s line %s at position %d",
-                     record.kind, record.line_id, record.position)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Redo: %s line %s at position %d",
+                         record.kind, record.line_id, record.position)
         return record
 
     # ------------------------------------------------------------------
     # Internal mutation primitives (no undo/event recording)
     # ------------------------------------------------------------------
 
-    def _apply_insert_line(self, position: int, line: DocumentLine) -> None:
-        """Internal insert primitive used by command replay paths."""
-        if line.line_id in self._index:
-            raise ValueError(f"Duplicate line_id: {line.line_id}")
-        self._lines.insert(position, line)
-        self._lines_cache = None
-        for lid, idx in self._index.items():
-            if idx >= position:
-                self._index[lid] = idx + 1
-        self._index[line.line_id] = position
-
-    def _apply_remove_line(self, line_id: str) -> DocumentLine:
+    def _apply_insert_line(self, position: int, line: DocumentLine) -> int:
+        """Internal insert primitive used by command replay paths.
+
+        Returns the position the line actually landed at (``list.insert``
+        semantics: negative positions count from the end, out-of-range
+        positions clamp).
+        """
+        line_id = line.line_id
+        if line_id in self._index:
+            raise ValueError(f"Duplicate line_id: {line_id}")
+        lines = self._lines
+        n = len(lines)
+        position = _clamp_insert_position(position, n)
+        lines.insert(position, line)
+        self._line_ids.insert(position, line_id)
+        # Stamp only the new line; the shifted suffix is renumbered lazily.
+        self._index[line_id] = position
+        self._lines_by_id[line_id] = line
+        if position < self._dirty_from:
+            self._dirty_from = position
+        elif self._dirty_from == n:
+            # Append to a clean index: every entry is still exact.
+            self._dirty_from = n + 1
+        return position
+
+    def _apply_remove_line(self, line_id: LineId) -> DocumentLine:
         """Internal remove primitive used by command replay paths."""
-        pos = self._index.pop(line_id)
+        pos = self._position_of(line_id)
+        del self._index[line_id]
+        del self._lines_by_id[line_id]
         removed = self._lines.pop(pos)
-        self._lines_cache = None
-        for lid, idx in self._index.items():
-            if idx > pos:
-                self._index[lid] = idx - 1
+        del self._line_ids[pos]
+        if pos < self._dirty_from:
+            self._dirty_from = pos
         return removed
 
-    def _apply_replace_line(self, line_id: str, new_line: DocumentLine) -> None:
-        """Internal replace primitive used by command replay paths."""
-        pos = self._index.pop(line_id)
-        self._lines[pos] = new_line
-        self._lines_cache = None
-        logger.debug("Replaced line %s at position %d", line_id, pos)
-        if new_line.line_id != line_id:
-            self._index[new_line.line_id] = pos
+    def _apply_insert_lines(self, position: int, new_lines: Sequence[DocumentLine]) -> int:
+        """Internal block-insert primitive: one splice, suffix re-indexed lazily.
+
+        Returns the position the block actually landed at, resolved the
+        same way as :meth:`_apply_insert_line`.
+        """
+        lines = self._lines
+        n = len(lines)
+        position = _clamp_insert_position(position, n)
+        index = self._index
+        new_ids = list(map(_line_id_of, new_lines))
+        seen: set[LineId] = set()
+        for line_id in new_ids:
+            if line_id in index or line_id in seen:
+                raise ValueError(f"Duplicate line_id: {line_id}")
+            seen.add(line_id)
+        lines[position:position] = new_lines
+        self._line_ids[position:position] = new_ids
+        index.update(zip(new_ids, range(position, len(lines))))
+        self._lines_by_id.update(zip(new_ids, new_lines))
+        if position < self._dirty_from:
+            self._dirty_from = position
+        elif self._dirty_from == n:
+            # Append to a clean index: every entry is still exact.
+            self._dirty_from = len(lines)
+        return position
+
+    def _apply_remove_lines(
+        self, line_ids: Sequence[LineId],
+    ) -> list[tuple[int, DocumentLine]]:
+        """Internal block-remove primitive.
+
+        Returns ``(position, line)`` pairs in ascending position order,
+        which :meth:`_apply_restore_lines` uses to undo the removal.
+        """
+        position_of = self._position_of
+        positions = sorted({position_of(line_id) for line_id in line_ids})
+        if not positions:
+            return []
+        lines = self._lines
+        ids = self._line_ids
+        removed = [(pos, lines[pos]) for pos in positions]
+        index = self._index
+        by_id = self._lines_by_id
+        for pos in positions:
+            line_id = ids[pos]
+            del index[line_id]
+            del by_id[line_id]
+        first, last = positions[0], positions[-1]
+        if last - first + 1 == len(positions):
+            del lines[first:last + 1]
+            del ids[first:last + 1]
         else:
-            self._index[line_id] = pos
+            for pos in reversed(positions):
+                del lines[pos]
+                del ids[pos]
+        if first < self._dirty_from:
+            self._dirty_from = first
+        return removed
+
+    def _apply_restore_lines(self, removed: Sequence[tuple[int, DocumentLine]]) -> None:
+        """Internal inverse of :meth:`_apply_remove_lines`."""
+        lines = self._lines
+        ids = self._line_ids
+        index = self._index
+        by_id = self._lines_by_id
+        for pos, line in removed:
+            line_id = line.line_id
+            lines.insert(pos, line)
+            ids.insert(pos, line_id)
+            index[line_id] = pos
+            by_id[line_id] = line
+        first = removed[0][0]
+        if first < self._dirty_from:
+            self._dirty_from = first
+
+    def _apply_replace_line(self, line_id: LineId, new_line: DocumentLine) -> int:
+        """Internal replace-by-id primitive.  Returns the line's position."""
+        pos = self._position_of(line_id)
+        self._apply_replace_at(pos, new_line)
+        return pos
+
+    def _apply_replace_at(self, pos: int, new_line: DocumentLine) -> None:
+        """Internal replace primitive for a known position.
+
+        Command replay uses this directly: a replace never moves lines,
+        so the position recorded at creation is still exact on replay.
+        """
+        line_id = self._line_ids[pos]
+        index = self._index
+        self._lines[pos] = new_line
+        # Replacements normally keep the id (edits, comment toggles), in
+        # which case the index entry is already correct.
+        new_id = new_line.line_id
+        if new_id != line_id:
+            self._line_ids[pos] = new_id
+            del index[line_id]
+            del self._lines_by_id[line_id]
+            index[new_id] = pos
+        self._lines_by_id[new_id] = new_line
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Replaced line %s at position %d", line_id, pos)
 
     def _apply_swap_lines(self, pos_a: int, pos_b: int) -> None:
-        """Internal swap primitive used by command replay paths."""
-        # Bounds check
-        if not (0 <= pos_a < len(self._lines)):
+        """Internal swap primitive: bounds-checked :meth:`_apply_swap_at`."""
+        n = len(self._lines)
+        if not (0 <= pos_a < n):
             raise IndexError(f"Position {pos_a} out of range")
-        if not (0 <= pos_b < len(self._lines)):
+        if not (0 <= pos_b < n):
             raise IndexError(f"Position {pos_b} out of range")
-
-        line_a = self._lines[pos_a]
-        line_b = self._lines[pos_b]
-        self._lines[pos_a] = line_b
-        self._lines[pos_b] = line_a
-        self._index[line_a.line_id] = pos_b
-        self._index[line_b.line_id] = pos_a
-        self._lines_cache = None
+        self._apply_swap_at(pos_a, pos_b)
+
+    def _apply_swap_at(self, pos_a: int, pos_b: int) -> None:
+        """Unchecked swap used by command replay (positions known valid)."""
+        lines = self._lines
+        ids = self._line_ids
+        lines[pos_a], lines[pos_b] = lines[pos_b], lines[pos_a]
+        id_a = ids[pos_a]
+        id_b = ids[pos_b]
+        ids[pos_a] = id_b
+        ids[pos_b] = id_a
+        index = self._index
+        index[id_a] = pos_b
+        index[id_b] = pos_a
 
     # ------------------------------------------------------------------
     # Internals
     # ------------------------------------------------------------------
 
+    def _record(self, cmd: Command) -> None:
+        """Push a new undo step and invalidate the redo history.
+
+        At the history limit the oldest step would be dropped silently
+        by the deque; it is popped here instead so its command goes back
+        to its pool.
+        """
+        undo = self._undo_stack
+        if len(undo) == undo.maxlen and undo:
+            undo.popleft().release()
+        undo.append(cmd)
+        if self._redo_stack:
+            self._discard_redo()
+
+    def _discard_redo(self) -> None:
+        """Drop the redo history, returning its commands to their pools.
+
+        Callers check ``self._redo_stack`` first: during plain forward
+        editing the stack is empty and the call is skipped entirely.
+        """
+        redo = self._redo_stack
+        for cmd in redo:
+            cmd.release()
+        redo.clear()
+
+    def _position_of(self, line_id: LineId) -> int:
+        """Exact position of *line_id*, reconciling the index if needed."""
+        pos = self._index[line_id]
+        if pos >= self._dirty_from:
+            self._reconcile()
+            pos = self._index[line_id]
+        return pos
+
+    def _reconcile(self) -> None:
+        """Renumber every line from the watermark to the end."""
+        self._reindex_from(self._dirty_from)
+        self._dirty_from = len(self._lines)
+
+    def _reindex_from(self, start: int) -> None:
+        """Re-stamp ``_index`` for every line at position >= *start*.
+
+        The loop runs inside ``dict.update`` over a ``zip`` of the id
+        list, so the per-line cost is C-level rather than one bytecode
+        round-trip per shifted line.
+        """
+        ids = self._line_ids
+        self._index.update(zip(ids[start:], range(start, len(ids))))
+
     def _rebuild_index(self) -> None:
-        self._index = {line.line_id: i for i, line in enumerate(self._lines)}
+        ids = self._line_ids
+        self._index = dict(zip(ids, range(len(ids))))
+        self._lines_by_id = dict(zip(ids, self._lines))
+        self._dirty_from = len(ids)
@@ -1,22 +1,51 @@
-"""Internal undo/redo command objects for :mod:`core.document`."""
+"""Internal undo/redo command objects for :mod:`core.document`.
+
+Commands live only on a document's undo/redo stacks, so their lifetime
+is fully owned by :class:`core.document.Document`.  Each command class
+keeps a small free list: commands discarded from the redo stack are
+released back to it and reused by the next mutation of the same kind.
+:class:`MutationRecord` instances are *not* pooled — they are handed to
+callers, which may hold on to them indefinitely.
+"""
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Optional, Protocol
+from typing import ClassVar, NamedTuple, Optional, Protocol, Sequence
 
-from core.document_line import DocumentLine
+from core.document_line import DocumentLine, LineId
 
 
-@dataclass(frozen=True, slots=True)
-class MutationRecord:
-    """Describes a mutation that was applied to a document."""
+class MutationRecord(NamedTuple):
+    """Describes a mutation that was applied to a document.
+
+    A ``NamedTuple`` rather than a frozen dataclass: one is built on
+    every mutation, undo and redo, and tuple construction is cheaper.
+
+    Block mutations (``"insert_block"`` / ``"remove_block"``) report the
+    first affected position and line_id, and list every affected line
+    in document order in ``lines``.  Swaps are reported as
+    :class:`SwapRecord`.
+    """
 
     kind: str
     position: int
-    line_id: str
+    line_id: LineId
     old_line: Optional[DocumentLine] = None
     new_line: Optional[DocumentLine] = None
-    position2: Optional[int] = None
+    lines: tuple[DocumentLine, ...] = ()
+
+
+class SwapRecord(NamedTuple):
+    """Describes an applied swap of the lines at ``position`` < ``position2``.
+
+    Kept apart from :class:`MutationRecord` so the common records do
+    not carry a second position; ``kind`` is a class constant.
+    """
+
+    position: int
+    line_id: LineId
+    position2: int
+
+    kind = "swap"
 
 
 class DocumentCommandTarget(Protocol):
@@ -24,27 +53,59 @@ class DocumentCommandTarget(Protocol):
 
     _lines: list[DocumentLine]
 
-    def get_position(self, line_id: str) -> int: ...
+    def _apply_insert_line(self, position: int, line: DocumentLine) -> int: ...
+
+    def _apply_remove_line(self, line_id: LineId) -> DocumentLine: ...
+
+    def _apply_replace_at(self, pos: int, new_line: DocumentLine) -> None: ...
 
-    def _apply_insert_line(self, position: int, line: DocumentLine) -> None: ...
+    def _apply_swap_at(self, pos_a: int, pos_b: int) -> None: ...
 
-    def _apply_remove_line(self, line_id: str) -> DocumentLine: ...
+    def _apply_insert_lines(self, position: int, lines: Sequence[DocumentLine]) -> int: ...
 
-    def _apply_replace_line(self, line_id: str, new_line: DocumentLine) -> None: ...
+    def _apply_remove_lines(
+        self, line_ids: Sequence[LineId],
+    ) -> list[tuple[int, DocumentLine]]: ...
 
-    def _apply_swap_lines(self, pos_a: int, pos_b: int) -> None: ...
+    def _apply_restore_lines(self, removed: Sequence[tuple[int, DocumentLine]]) -> None: ...
 
 
-class Command(Protocol):
-    """Reversible mutation — every command knows how to undo and redo itself."""
+# Upper bound on each command class's free list.
+_POOL_LIMIT = 256
 
-    def undo(self, doc: DocumentCommandTarget) -> MutationRecord: ...
 
-    def redo(self, doc: DocumentCommandTarget) -> MutationRecord: ...
+class _PooledCmd:
+    """Base for commands that recycle instances through a per-class free list."""
 
+    __slots__ = ()
 
-class InsertCmd:
-    """Reversible insert — undo removes the line, redo re-inserts it."""
+    _free: ClassVar[list]
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._free = []
+
+    def release(self) -> None:
+        """Return this command to its class's free list.
+
+        Only call this once the command has left every undo/redo stack;
+        it must not be used again until handed out by ``acquire``.
+        Fields are cleared so pooled instances do not pin old lines.
+        """
+        free = self._free
+        if len(free) < _POOL_LIMIT:
+            for name in type(self).__slots__:
+                setattr(self, name, None)
+            free.append(self)
+
+
+class InsertCmd(_PooledCmd):
+    """Reversible insert — undo removes the line, redo re-inserts it.
+
+    Undo/redo replay strictly in LIFO order, so whenever a command is
+    replayed the document is in exactly the state it left it in: the
+    recorded position is still correct and needs no index lookup.
+    """
 
     __slots__ = ("_position", "_line")
 
@@ -52,17 +113,26 @@ class InsertCmd:
         self._position = position
         self._line = line
 
+    @classmethod
+    def acquire(cls, position: int, line: DocumentLine) -> InsertCmd:
+        """Return a pooled instance initialised like ``InsertCmd(position, line)``."""
+        if cls._free:
+            cmd = cls._free.pop()
+            cmd._position = position
+            cmd._line = line
+            return cmd
+        return cls(position, line)
+
     def undo(self, doc: DocumentCommandTarget) -> MutationRecord:
-        pos = doc.get_position(self._line.line_id)
         doc._apply_remove_line(self._line.line_id)
-        return MutationRecord("remove", pos, self._line.line_id, old_line=self._line)
+        return MutationRecord("remove", self._position, self._line.line_id, old_line=self._line)
 
     def redo(self, doc: DocumentCommandTarget) -> MutationRecord:
         doc._apply_insert_line(self._position, self._line)
         return MutationRecord("insert", self._position, self._line.line_id, new_line=self._line)
 
 
-class RemoveCmd:
+class RemoveCmd(_PooledCmd):
     """Reversible remove — undo re-inserts the line, redo removes it."""
 
     __slots__ = ("_position", "_line")
@@ -71,6 +141,16 @@ class RemoveCmd:
         self._position = position
         self._line = line
 
+    @classmethod
+    def acquire(cls, position: int, line: DocumentLine) -> RemoveCmd:
+        """Return a pooled instance initialised like ``RemoveCmd(position, line)``."""
+        if cls._free:
+            cmd = cls._free.pop()
+            cmd._position = position
+            cmd._line = line
+            return cmd
+        return cls(position, line)
+
     def undo(self, doc: DocumentCommandTarget) -> MutationRecord:
         doc._apply_insert_line(self._position, self._line)
         return MutationRecord("insert", self._position, self._line.line_id, new_line=self._line)
@@ -80,55 +160,151 @@ class RemoveCmd:
         return MutationRecord("remove", self._position, self._line.line_id, old_line=self._line)
 
 
-class ReplaceCmd:
-    """Reversible replace — undo restores the old line, redo reapplies."""
+class ReplaceCmd(_PooledCmd):
+    """Reversible replace — undo restores the old line, redo reapplies.
+
+    Like :class:`InsertCmd`, the position is recorded once at creation
+    and stays valid for every LIFO replay.
+    """
 
-    __slots__ = ("_old_line", "_new_line")
+    __slots__ = ("_position", "_old_line", "_new_line")
 
-    def __init__(self, old_line: DocumentLine, new_line: DocumentLine) -> None:
+    def __init__(self, position: int, old_line: DocumentLine, new_line: DocumentLine) -> None:
+        self._position = position
         self._old_line = old_line
         self._new_line = new_line
 
+    @classmethod
+    def acquire(
+        cls, position: int, old_line: DocumentLine, new_line: DocumentLine,
+    ) -> ReplaceCmd:
+        """Return a pooled instance initialised like ``ReplaceCmd(position, old_line, new_line)``."""
+        if cls._free:
+            cmd = cls._free.pop()
+            cmd._position = position
+            cmd._old_line = old_line
+            cmd._new_line = new_line
+            return cmd
+        return cls(position, old_line, new_line)
+
     def undo(self, doc: DocumentCommandTarget) -> MutationRecord:
-        pos = doc.get_position(self._new_line.line_id)
-        doc._apply_replace_line(self._new_line.line_id, self._old_line)
+        doc._apply_replace_at(self._position, self._old_line)
         return MutationRecord(
-            "replace", pos, self._old_line.line_id, old_line=self._new_line, new_line=self._old_line
+            "replace", self._position, self._old_line.line_id,
+            old_line=self._new_line, new_line=self._old_line,
         )
 
     def redo(self, doc: DocumentCommandTarget) -> MutationRecord:
-        pos = doc.get_position(self._old_line.line_id)
-        doc._apply_replace_line(self._old_line.line_id, self._new_line)
+        doc._apply_replace_at(self._position, self._new_line)
         return MutationRecord(
-            "replace", pos, self._new_line.line_id, old_line=self._old_line, new_line=self._new_line
+            "replace", self._position, self._new_line.line_id,
+            old_line=self._old_line, new_line=self._new_line,
         )
 
 
-class SwapCmd:
-    """Reversible swap of two lines by position."""
+class SwapCmd(_PooledCmd):
+    """Reversible swap of two lines by position.
+
+    ``line_id_a`` / ``line_id_b`` are the ids that sit at ``pos_a`` /
+    ``pos_b`` *before* the swap, so replay never has to index the list
+    to build its record.
+    """
 
-    __slots__ = ("_pos_a", "_pos_b")
+    __slots__ = ("_pos_a", "_pos_b", "_line_id_a", "_line_id_b")
 
-    def __init__(self, pos_a: int, pos_b: int) -> None:
+    def __init__(
+        self, pos_a: int, pos_b: int, line_id_a: LineId, line_id_b: LineId,
+    ) -> None:
         self._pos_a = pos_a
         self._pos_b = pos_b
+        self._line_id_a = line_id_a
+        self._line_id_b = line_id_b
+
+    @classmethod
+    def acquire(
+        cls, pos_a: int, pos_b: int, line_id_a: LineId, line_id_b: LineId,
+    ) -> SwapCmd:
+        """Return a pooled instance initialised like ``SwapCmd(...)``."""
+        if cls._free:
+            cmd = cls._free.pop()
+            cmd._pos_a = pos_a
+            cmd._pos_b = pos_b
+            cmd._line_id_a = line_id_a
+            cmd._line_id_b = line_id_b
+            return cmd
+        return cls(pos_a, pos_b, line_id_a, line_id_b)
+
+    def _replay(self, doc: DocumentCommandTarget, line_id: LineId) -> SwapRecord:
+        pos_a, pos_b = self._pos_a, self._pos_b
+        doc._apply_swap_at(pos_a, pos_b)
+        if pos_a < pos_b:
+            return SwapRecord(pos_a, line_id, pos_b)
+        return SwapRecord(pos_b, line_id, pos_a)
+
+    # The record reports the line that was at ``pos_a`` before the replay:
+    # line b while the swap is applied, line a once it has been undone.
+    def undo(self, doc: DocumentCommandTarget) -> SwapRecord:
+        return self._replay(doc, self._line_id_b)
+
+    def redo(self, doc: DocumentCommandTarget) -> SwapRecord:
+        return self._replay(doc, self._line_id_a)
+
+
+class InsertBlockCmd:
+    """Reversible insert of a contiguous block of lines as one undo step."""
+
+    __slots__ = ("_position", "_lines")
+
+    def __init__(self, position: int, lines: tuple[DocumentLine, ...]) -> None:
+        self._position = position
+        self._lines = lines
 
     def undo(self, doc: DocumentCommandTarget) -> MutationRecord:
-        line_a = doc._lines[self._pos_a]
-        doc._apply_swap_lines(self._pos_a, self._pos_b)
+        doc._apply_remove_lines([line.line_id for line in self._lines])
+        first = self._lines[0]
         return MutationRecord(
-            "swap",
-            min(self._pos_a, self._pos_b),
-            line_a.line_id,
-            position2=max(self._pos_a, self._pos_b),
+            "remove_block", self._position, first.line_id, lines=self._lines,
         )
 
     def redo(self, doc: DocumentCommandTarget) -> MutationRecord:
-        line_a = doc._lines[self._pos_a]
-        doc._apply_swap_lines(self._pos_a, self._pos_b)
+        doc._apply_insert_lines(self._position, self._lines)
+        first = self._lines[0]
         return MutationRecord(
-            "swap",
-            min(self._pos_a, self._pos_b),
-            line_a.line_id,
-            position2=max(self._pos_a, self._pos_b),
+            "insert_block", self._position, first.line_id, lines=self._lines,
         )
+
+    def release(self) -> None:
+        """Block commands are rare and not pooled."""
+
+
+class RemoveBlockCmd:
+    """Reversible removal of several (not necessarily adjacent) lines."""
+
+    __slots__ = ("_removed",)
+
+    def __init__(self, removed: list[tuple[int, DocumentLine]]) -> None:
+        # (original position, line) pairs in ascending position order
+        self._removed = removed
+
+    def undo(self, doc: DocumentCommandTarget) -> MutationRecord:
+        doc._apply_restore_lines(self._removed)
+        return self._record("insert_block")
+
+    def redo(self, doc: DocumentCommandTarget) -> MutationRecord:
+        doc._apply_remove_lines([line.line_id for _, line in self._removed])
+        return self._record("remove_block")
+
+    def release(self) -> None:
+        """Block commands are rare and not pooled."""
+
+    def _record(self, kind: str) -> MutationRecord:
+        first_pos, first = self._removed[0]
+        return MutationRecord(
+            kind, first_pos, first.line_id,
+            lines=tuple(line for _, line in self._removed),
+        )
+
+
+# Closed set of command types kept on the undo/redo stacks.  A plain
+# union rather than a ``Protocol``: nothing dispatches on it at runtime.
+Command = InsertCmd | RemoveCmd | ReplaceCmd | SwapCmd | InsertBlockCmd | RemoveBlockCmd
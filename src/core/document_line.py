@@ -2,17 +2,23 @@
 DocumentLine — the unit of display for any configuration document.
 
 Each line in a file becomes one DocumentLine.  The frontend addresses
-lines by their 0-based position; ``line_id`` is an internal stable UUID
-used only within the backend (e.g. for conflict detection indexes).
+lines by their 0-based position; ``line_id`` is an internal stable integer
+id used only within the backend (e.g. for conflict detection indexes).
 """
 from __future__ import annotations
 
-import uuid
+import itertools
 from dataclasses import dataclass, field
 
 from core.interfaces import HasNetSpecs
 from core.line_status import LineStatus
-from core.validation_result import ValidationResult
+from core.validation_result import OK_RESULT, ValidationResult
+
+# A process-wide counter: ids only have to be unique among live lines,
+# never leave the backend, and small ints hash to themselves.
+LineId = int
+
+_next_line_id = itertools.count().__next__
 
 
 @dataclass(frozen=True, slots=True)
@@ -21,7 +27,7 @@ class DocumentLine:
     Immutable representation of one line in a document.
 
     Attributes:
-        line_id:           Internal stable UUID used by the backend for
+        line_id:           Internal stable integer id used by the backend for
                            conflict-detection indexes and the ``Document``
                            index.  Never exposed to the frontend.
         raw_text:          Original text that was read from the file (preserved
@@ -30,13 +36,16 @@ class DocumentLine:
         validation_result: Single source of truth for the line's health.
                            Holds the status (OK / WARNING / ERROR / COMMENT / EMPTY)
                            and any associated error or warning messages.
+        status:            ``validation_result.status``, derived at
+                           construction.
     """
-    line_id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    line_id: LineId = field(default_factory=_next_line_id)
     raw_text: str = ""
     data: HasNetSpecs | None = None
-    validation_result: ValidationResult = field(default_factory=ValidationResult)
+    validation_result: ValidationResult = OK_RESULT
+    # Copy of ``validation_result.status``, stored so coloring passes
+    # read one slot instead of hopping through the result.
+    status: LineStatus = field(init=False, repr=False, compare=False)
 
-    @property
-    def status(self) -> LineStatus:
-        """Convenience accessor — delegates to ``validation_result.status``."""
-        return self.validation_result.status
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "status", self.validation_result.status)
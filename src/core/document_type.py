@@ -1,9 +1,14 @@
 from __future__ import annotations
 
-from enum import Enum
+from enum import StrEnum
 
 
-class DocumentType(Enum):
-    """Determines which parser / validator / serializer family to use."""
+class DocumentType(StrEnum):
+    """Determines which parser / validator / serializer family to use.
+
+    A ``StrEnum`` so members hash and compare with ``str``'s C slots —
+    ``Enum.__hash__`` is a Python-level function, and every registry
+    and controller lookup is keyed by document type.
+    """
     AF = "af"
     MUTEX = "mutex"
@@ -12,7 +12,7 @@ they only need to provide the required attributes and methods.
 """
 from __future__ import annotations
 
-from typing import Generic, Protocol, Optional, TypeVar, runtime_checkable
+from typing import Protocol, Optional, TypeVar
 
 from core.net_spec import NetSpec
 from core.validation_result import ValidationResult
@@ -39,11 +39,13 @@ class INetlistQueryService(Protocol):
         net_regex: bool,
     ) -> tuple[list[str], list[str]]: ...
 
+    # Should return a frozenset of interned names: callers cache the
+    # result as-is.  Any other collection is copied and interned.
     def find_net_instance_names(
         self,
         template: str,
         net_name: str,
-    ) -> set[str]: ...
+    ) -> frozenset[str] | set[str]: ...
 
     def get_canonical_net_name(
         self,
@@ -92,7 +94,6 @@ class INetlistQueryService(Protocol):
     ) -> list[str]: ...
 
 
-@runtime_checkable
 class IEditSessionState(Protocol):
     """Mutable state for a single line edit session."""
     session_id: str
@@ -104,7 +105,6 @@ class IEditSessionState(Protocol):
         ...
 
 
-@runtime_checkable
 class IEditController(Protocol[T]):
     """
     Orchestrates editing a single line in a document.
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 
 from core.line_status import LineStatus
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class ValidationResult:
     """
     Outcome of validating a document line.
@@ -20,10 +21,16 @@ class ValidationResult:
 
     Passing a non-OK *status* together with *errors* or *warnings*
     is a programming error and raises ``ValueError``.
+
+    Instances are immutable and message-free results default to empty
+    tuples, so the common outcomes are shared: use :data:`OK_RESULT`
+    and :data:`COMMENT_RESULT` instead of building new ones per line.
     """
     status: LineStatus = LineStatus.OK
-    errors: list[str] = field(default_factory=list)
-    warnings: list[str] = field(default_factory=list)
+    errors: Sequence[str] = ()
+    warnings: Sequence[str] = ()
+    # Derived once in __post_init__; read on every line by coloring passes.
+    _is_valid: bool = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
         has_messages = bool(self.errors) or bool(self.warnings)
@@ -34,13 +41,56 @@ class ValidationResult:
                 f"or pass status only for non-data lines (no errors/warnings)."
             )
         if self.errors:
-            self.status = LineStatus.ERROR
-        elif self.warnings:
-            self.status = LineStatus.WARNING
+            object.__setattr__(self, "status", LineStatus.ERROR)
+            object.__setattr__(self, "_is_valid", False)
+            return
+        if self.warnings:
+            object.__setattr__(self, "status", LineStatus.WARNING)
+        object.__setattr__(self, "_is_valid", True)
+
+    # Fast-path constructors: the status is known up front, so they set
+    # the slots directly and skip __init__ / __post_init__.
+
+    @classmethod
+    def error(
+        cls, errors: Sequence[str], warnings: Sequence[str] = (),
+    ) -> ValidationResult:
+        """Build an ERROR result.  *errors* must be non-empty."""
+        if not errors:
+            raise ValueError("ValidationResult.error() needs at least one error.")
+        return cls._make(LineStatus.ERROR, errors, warnings, False)
+
+    @classmethod
+    def warning(cls, warnings: Sequence[str]) -> ValidationResult:
+        """Build a WARNING result.  *warnings* must be non-empty."""
+        if not warnings:
+            raise ValueError("ValidationResult.warning() needs at least one warning.")
+        return cls._make(LineStatus.WARNING, (), warnings, True)
+
+    @classmethod
+    def _make(
+        cls,
+        status: LineStatus,
+        errors: Sequence[str],
+        warnings: Sequence[str],
+        is_valid: bool,
+    ) -> ValidationResult:
+        self = object.__new__(cls)
+        setattr_ = object.__setattr__
+        setattr_(self, "status", status)
+        setattr_(self, "errors", errors)
+        setattr_(self, "warnings", warnings)
+        setattr_(self, "_is_valid", is_valid)
+        return self
 
     @property
     def is_valid(self) -> bool:
-        return len(self.errors) == 0
+        return self._is_valid
 
     def __bool__(self) -> bool:
-        return self.is_valid
+        return self._is_valid
+
+
+# Shared results for lines without messages (parsed OK / blank, comment).
+OK_RESULT = ValidationResult()
+COMMENT_RESULT = ValidationResult(status=LineStatus.COMMENT)
@@ -39,7 +39,8 @@ class AfEditController:
     # ---------------------------
 
     def set_template(self, name: Optional[str]) -> None:
-        self._session.template_name = name
+        # An empty name means "no template", as in from_dict().
+        self._session.template_name = name or None
 
     def set_template_regex(self, is_regex: bool = True) -> None:
         self._session.template_regex_mode = is_regex
@@ -95,10 +96,11 @@ class AfEditController:
         """
         Hydrate session state from an existing line (edit flow).
         """
-        self._session.template_name = data.template
-        self._session.template_regex_mode = data.is_template_regex
-        self._session.net_name = data.net
-        self._session.net_regex_mode = data.is_net_regex
-        self._session.af_value = data.af_value
-        self._session.em_enabled = data.is_em_enabled
-        self._session.sh_enabled = data.is_sh_enabled
+        session = self._session
+        session.template_name = data.template
+        session.template_regex_mode = data.is_template_regex
+        session.net_name = data.net
+        session.net_regex_mode = data.is_net_regex
+        session.af_value = data.af_value
+        session.em_enabled = data.is_em_enabled
+        session.sh_enabled = data.is_sh_enabled
@@ -5,8 +5,6 @@ Line format: {template:net} AF_VALUE flags   or   {net} AF_VALUE flags
 """
 from __future__ import annotations
 
-import re
-
 from doc_types.af.line_data import AfLineData
 
 
@@ -22,15 +20,36 @@ FLAG_TEMPLATE_REGULAR = "template-regular"
 FLAG_SEPARATOR = "_"
 COMMENT_INDICATOR = "#"
 
-CFG_OPTIONS = {
+CFG_OPTIONS = frozenset({
     FLAG_NET_REGEXP, FLAG_NET_REGULAR,
     FLAG_TEMPLATE_REGEXP, FLAG_TEMPLATE_REGULAR,
     FLAG_EM, FLAG_SH, FLAG_SCH,
+})
+NET_OPTIONS = frozenset({FLAG_NET_REGEXP, FLAG_NET_REGULAR})
+TEMPLATE_OPTIONS = frozenset({FLAG_TEMPLATE_REGEXP, FLAG_TEMPLATE_REGULAR})
+
+# parse() maps each cfg token to one bit, so validating a token, spotting
+# a duplicate and reading a flag are all integer operations.
+_BIT_NET_REGEXP = 1 << 0
+_BIT_NET_REGULAR = 1 << 1
+_BIT_TEMPLATE_REGEXP = 1 << 2
+_BIT_TEMPLATE_REGULAR = 1 << 3
+_BIT_EM = 1 << 4
+_BIT_SH = 1 << 5
+_BIT_SCH = 1 << 6
+_NET_BITS = _BIT_NET_REGEXP | _BIT_NET_REGULAR
+_TEMPLATE_BITS = _BIT_TEMPLATE_REGEXP | _BIT_TEMPLATE_REGULAR
+_EM_SH_BITS = _BIT_EM | _BIT_SH
+
+_FLAG_BITS: dict[str, int] = {
+    FLAG_NET_REGEXP: _BIT_NET_REGEXP,
+    FLAG_NET_REGULAR: _BIT_NET_REGULAR,
+    FLAG_TEMPLATE_REGEXP: _BIT_TEMPLATE_REGEXP,
+    FLAG_TEMPLATE_REGULAR: _BIT_TEMPLATE_REGULAR,
+    FLAG_EM: _BIT_EM,
+    FLAG_SH: _BIT_SH,
+    FLAG_SCH: _BIT_SCH,
 }
-NET_OPTIONS = {FLAG_NET_REGEXP, FLAG_NET_REGULAR}
-TEMPLATE_OPTIONS = {FLAG_TEMPLATE_REGEXP, FLAG_TEMPLATE_REGULAR}
-
-_BUS_RE = re.compile(r"\[\d+[:\-]\d+\]")
 
 
 def is_comment(text: str) -> bool:
@@ -41,6 +60,38 @@ def is_empty(text: str) -> bool:
     return not text.strip()
 
 
+def _strip_bus(s: str) -> str:
+    """
+    Return *s* with every ``[N:M]`` / ``[N-M]`` bus range removed.
+
+    Same result as the bus-range regex it replaced (kept as the reference
+    in the parser tests), but a few ``str.find`` probes per bracket are
+    cheaper than entering the regex engine per line.
+    """
+    find = s.find
+    i = find("[")
+    if i < 0:
+        return s
+    kept: list[str] = []
+    start = 0
+    while i >= 0:
+        end = find("]", i + 1)
+        if end < 0:
+            break
+        body = s[i + 1:end]
+        lo, sep, hi = body.partition(":")
+        if not sep:
+            lo, sep, hi = body.partition("-")
+        if sep and lo.isdecimal() and hi.isdecimal():
+            kept.append(s[start:i])
+            start = end + 1
+            i = find("[", start)
+        else:
+            i = find("[", i + 1)
+    kept.append(s[start:])
+    return "".join(kept)
+
+
 def parse(text: str) -> AfLineData:
     """
     Parse an AF configuration line into a typed AfLineData.
@@ -49,8 +100,8 @@ def parse(text: str) -> AfLineData:
     Comments and blank lines should be checked by the caller before
     calling parse() — they are not AF data lines.
     """
-    content = text.strip()
-    parts = content.split()
+    # split() with no separator already drops surrounding whitespace.
+    parts = text.split()
     if len(parts) != 3:
         raise ValueError("AF line must contain exactly 3 whitespace-separated fields")
 
@@ -60,14 +111,12 @@ def parse(text: str) -> AfLineData:
     if not raw_name:
         raise ValueError("Name field cannot be empty")
 
-    is_braced = raw_name.startswith("{") and raw_name.endswith("}")
-    has_partial = (
-        (raw_name.startswith("{") and not raw_name.endswith("}"))
-        or (not raw_name.startswith("{") and raw_name.endswith("}"))
-    )
-    if has_partial:
+    opens = raw_name[0] == "{"
+    closes = raw_name[-1] == "}"
+    if opens != closes:
         raise ValueError("Unbalanced braces in name field")
-    if ("{" in raw_name or "}" in raw_name) and not is_braced:
+    is_braced = opens
+    if not is_braced and ("{" in raw_name or "}" in raw_name):
         raise ValueError("Braces are only allowed as a single outer pair around name")
 
     name = raw_name[1:-1] if is_braced else raw_name
@@ -82,48 +131,62 @@ def parse(text: str) -> AfLineData:
 
     # ---- cfg flags ----
     cfg_list = cfg_text.split(FLAG_SEPARATOR)
-    if not cfg_list or any(not f for f in cfg_list):
+    if "" in cfg_list:
         raise ValueError("cfg_options cannot contain empty tokens")
 
-    invalid = [f for f in cfg_list if f not in CFG_OPTIONS]
+    # One pass classifies every token; invalid ones are still reported
+    # ahead of duplicates, as before.
+    flag_bit = _FLAG_BITS.get
+    mask = 0
+    invalid: list[str] = []
+    dupes: set[str] = set()
+    for f in cfg_list:
+        bit = flag_bit(f)
+        if bit is None:
+            invalid.append(f)
+        elif mask & bit:
+            dupes.add(f)
+        else:
+            mask |= bit
     if invalid:
         raise ValueError(f"Invalid cfg option(s): {', '.join(invalid)}")
-
-    dupes = sorted({f for f in cfg_list if cfg_list.count(f) > 1})
     if dupes:
-        raise ValueError(f"Duplicate cfg option(s): {', '.join(dupes)}")
+        raise ValueError(f"Duplicate cfg option(s): {', '.join(sorted(dupes))}")
 
-    net_modes = [f for f in cfg_list if f in NET_OPTIONS]
-    if not net_modes:
+    net_bits = mask & _NET_BITS
+    if not net_bits:
         raise ValueError("Missing required net option (net-regexp or net-regular)")
-    if len(net_modes) > 1:
+    if net_bits == _NET_BITS:
         raise ValueError("Only one net option is allowed")
 
-    template_modes = [f for f in cfg_list if f in TEMPLATE_OPTIONS]
-    if len(template_modes) > 1:
+    template_bits = mask & _TEMPLATE_BITS
+    if template_bits == _TEMPLATE_BITS:
         raise ValueError("Only one template option is allowed")
 
-    is_net_regex = net_modes[0] == FLAG_NET_REGEXP
-    is_template_regex = (template_modes[0] == FLAG_TEMPLATE_REGEXP) if template_modes else False
-
-    is_sch_enabled = FLAG_SCH in cfg_list
-    is_em_enabled = FLAG_EM in cfg_list
-    is_sh_enabled = FLAG_SH in cfg_list
-
     # default: both enabled when neither specified
-    if not is_em_enabled and not is_sh_enabled:
-        is_em_enabled = True
-        is_sh_enabled = True
+    if not mask & _EM_SH_BITS:
+        mask |= _EM_SH_BITS
+
+    is_net_regex = net_bits == _BIT_NET_REGEXP
+    is_template_regex = template_bits == _BIT_TEMPLATE_REGEXP
+    is_em_enabled = bool(mask & _BIT_EM)
+    is_sh_enabled = bool(mask & _BIT_SH)
+    is_sch_enabled = bool(mask & _BIT_SCH)
 
     # ---- template / net split ----
-    template_needed = len(template_modes) == 1
+    template_needed = bool(template_bits)
     template_name: str | None = None
     net_name = name
     if template_needed:
-        name_no_bus = _BUS_RE.sub("", name)
+        # Stripping bus ranges can only remove colons, and only a name
+        # with a '[' can hold one: skip the regex unless both are present.
+        if "[" in name and ":" in name:
+            name_no_bus = _strip_bus(name)
+        else:
+            name_no_bus = name
         if name_no_bus.count(":") != 1:
             raise ValueError("Template mode requires exactly one ':' in name (ignoring bus notation)")
-        template_name, net_name = name.split(":", 1)
+        template_name, _, net_name = name.partition(":")
         if not template_name or not net_name:
             raise ValueError("Template mode requires non-empty template and net names")
 
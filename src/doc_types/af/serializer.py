@@ -6,8 +6,6 @@ JSON round-trip helpers (``from_dict`` / ``to_json``).
 """
 from __future__ import annotations
 
-import dataclasses
-
 from doc_types.af.line_data import AfLineData
 from doc_types.af.parser import (
     FLAG_EM, FLAG_SH, FLAG_SCH,
@@ -17,42 +15,71 @@ from doc_types.af.parser import (
 )
 
 
-def serialize(data: AfLineData) -> str:
-    """Serialize an AfLineData into a single config line string."""
-    if not data.net:
-        raise ValueError("net is required for AF serialization")
-
-    is_em = data.is_em_enabled
-    is_sh = data.is_sh_enabled
-    # If both disabled, treat as both enabled
-    if not is_em and not is_sh:
-        is_em = True
-        is_sh = True
-
+def _cfg_string(
+    net_regex: bool,
+    has_template: bool,
+    template_regex: bool,
+    sch: bool,
+    em: bool,
+    sh: bool,
+) -> str:
     flags: list[str] = []
 
     # net regex flag (required)
-    flags.append(FLAG_NET_REGEXP if data.is_net_regex else FLAG_NET_REGULAR)
+    flags.append(FLAG_NET_REGEXP if net_regex else FLAG_NET_REGULAR)
 
     # template regex flag (only when template is set)
-    if data.template is not None:
-        flags.append(FLAG_TEMPLATE_REGEXP if data.is_template_regex else FLAG_TEMPLATE_REGULAR)
+    if has_template:
+        flags.append(FLAG_TEMPLATE_REGEXP if template_regex else FLAG_TEMPLATE_REGULAR)
 
     # feature flags
-    if data.is_sch_enabled:
+    if sch:
         flags.append(FLAG_SCH)
-    if is_em:
+    if em:
         flags.append(FLAG_EM)
-    if is_sh:
+    if sh:
         flags.append(FLAG_SH)
 
-    cfg_str = FLAG_SEPARATOR.join(flags)
+    return FLAG_SEPARATOR.join(flags)
+
+
+# Every cfg string, indexed by the six flag bits packed as in serialize().
+_CFG_STRINGS: tuple[str, ...] = tuple(
+    _cfg_string(*(bool(key >> bit & 1) for bit in range(6)))
+    for key in range(64)
+)
+
+
+def serialize(data: AfLineData) -> str:
+    """Serialize an AfLineData into a single config line string."""
+    net = data.net
+    if not net:
+        raise ValueError("net is required for AF serialization")
+
+    is_em = data.is_em_enabled
+    is_sh = data.is_sh_enabled
+    # If both disabled, treat as both enabled
+    if not is_em and not is_sh:
+        is_em = True
+        is_sh = True
+
+    # The parser never yields an empty template, so "" and None both
+    # mean "no template".
+    template = data.template
+    cfg_str = _CFG_STRINGS[
+        bool(data.is_net_regex)
+        | bool(template) << 1
+        | bool(data.is_template_regex) << 2
+        | bool(data.is_sch_enabled) << 3
+        | bool(is_em) << 4
+        | bool(is_sh) << 5
+    ]
 
     # name field
-    if data.template is not None:
-        name = f"{{{data.template}:{data.net}}}"
+    if template:
+        name = f"{{{template}:{net}}}"
     else:
-        name = f"{{{data.net}}}"
+        name = f"{{{net}}}"
 
     return f"{name} {data.af_value} {cfg_str}"
 
@@ -76,4 +103,15 @@ def from_dict(fields: dict) -> AfLineData:
 
 def to_json(data: AfLineData) -> dict:
     """Convert AfLineData to a JSON-safe dict."""
-    return dataclasses.asdict(data)
+    # Every field is a scalar, so an explicit literal matches asdict()
+    # without its recursive copy.
+    return {
+        "template": data.template,
+        "net": data.net,
+        "af_value": data.af_value,
+        "is_template_regex": data.is_template_regex,
+        "is_net_regex": data.is_net_regex,
+        "is_em_enabled": data.is_em_enabled,
+        "is_sh_enabled": data.is_sh_enabled,
+        "is_sch_enabled": data.is_sch_enabled,
+    }
@@ -14,7 +14,7 @@ from __future__ import annotations
 from typing import Optional, TYPE_CHECKING
 
 from doc_types.af.line_data import AfLineData
-from core.validation_result import ValidationResult
+from core.validation_result import OK_RESULT, ValidationResult
 
 if TYPE_CHECKING:
     from core.interfaces import INetlistQueryService
@@ -34,67 +34,73 @@ def validate(
               are appended.
 
     Returns:
-        ValidationResult with errors and warnings.
+        ValidationResult with errors and warnings.  Results without
+        messages are the shared, immutable ``OK_RESULT``.
     """
-    errors: list[str] = []
-    warnings: list[str] = []
-
     # ---- Layer 2: domain (pure, no service) ----
 
-    if not data.net:
-        errors.append("Net name cannot be empty.")
-
-    if not (0 <= data.af_value <= 1):
-        errors.append("AF value must be between 0 and 1.")
-
-    if not data.is_em_enabled and not data.is_sh_enabled:
-        errors.append("At least one of EM or SH must be enabled.")
-
-    # Stop here if domain errors exist or no service available
-    if errors or nqs is None:
-        return ValidationResult(errors=errors, warnings=warnings)
+    net = data.net
+    af_value = data.af_value
+    em = data.is_em_enabled
+    sh = data.is_sh_enabled
+
+    # Valid lines pass one fused test; messages are built only on failure.
+    if not net or not (0 <= af_value <= 1) or not (em or sh):
+        errors: list[str] = []
+        if not net:
+            errors.append("Net name cannot be empty.")
+        if not (0 <= af_value <= 1):
+            errors.append("AF value must be between 0 and 1.")
+        if not em and not sh:
+            errors.append("At least one of EM or SH must be enabled.")
+        return ValidationResult.error(errors)
+
+    # Stop here if no service available.  Message-free outcomes share
+    # the immutable OK_RESULT rather than allocating a new result.
+    if nqs is None:
+        return OK_RESULT
 
     # ---- Layer 3: netlist (service-dependent warnings) ----
 
-    if not data.net:
-        return ValidationResult(errors=errors, warnings=warnings)
+    warnings: list[str] = []
 
-    # Template existence check
-    if data.template is not None:
-        templates = nqs.get_matching_templates(data.template, data.is_template_regex)
-        if not templates:
+    nets, _ = nqs.find_matches(
+        data.template, net, data.is_template_regex, data.is_net_regex,
+    )
+
+    if not nets:
+        # Nets only match inside matching templates, so the template
+        # lookup is needed just to tell the two failures apart.
+        if data.template and not nqs.get_matching_templates(
+            data.template, data.is_template_regex,
+        ):
             msg = (
                 f"No matching templates found for pattern '{data.template}'."
                 if data.is_template_regex
                 else f"Template '{data.template}' does not exist in the netlist."
             )
             warnings.append(msg)
-            return ValidationResult(errors=errors, warnings=warnings)
-    
-    nets, _ = nqs.find_matches(
-        data.template, data.net, data.is_template_regex, data.is_net_regex,
-    )
+        else:
+            warnings.append(f"No matches found for pattern '{net}'.")
+        return ValidationResult.warning(warnings)
 
-    # Net match check
-    if not nets:
-        warnings.append(f"No matches found for pattern '{data.net}'.")
-        return ValidationResult(errors=errors, warnings=warnings)
+    has_bus = nqs.has_bus_notation(net)
 
     # Canonical name suggestion (non-regex, non-bus only)
-    if not data.is_net_regex and not nqs.has_bus_notation(data.net):
-        canonical = nqs.get_canonical_net_name(data.net, data.template)
-        if canonical and canonical != data.net:
+    if not data.is_net_regex and not has_bus:
+        canonical = nqs.get_canonical_net_name(net, data.template)
+        if canonical and canonical != net:
             warnings.append(
-                f"Provided net name '{data.net}' is not canonical, "
+                f"Provided net name '{net}' is not canonical, "
                 f"please use '{canonical}' instead."
             )
 
     # Bus width check (non-regex only)
-    if not data.is_net_regex and nqs.has_bus_notation(data.net):
-        expanded = nqs.expand_bus_notation(data.net)
+    if not data.is_net_regex and has_bus:
+        expanded = nqs.expand_bus_notation(net)
         if expanded and len(nets) < len(expanded):
             warnings.append(
-                f"Bus notation '{data.net}' is larger than existing nets ({len(nets)}) in the netlist."
+                f"Bus notation '{net}' is larger than existing nets ({len(nets)}) in the netlist."
             )
 
-    return ValidationResult(errors=errors, warnings=warnings)
+    return ValidationResult.warning(warnings) if warnings else OK_RESULT
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from enum import Enum
 from typing import Optional
 
@@ -14,6 +14,11 @@ class FEVMode(Enum):
     IGNORE = "ignore"
 
 
+# Plain dict lookup for already-validated suffixes; FEVMode(value) goes
+# through EnumType.__call__ and Enum.__new__ on every line.
+FEV_BY_VALUE: dict[str, FEVMode] = {m.value: m for m in FEVMode}
+
+
 @dataclass(frozen=True, slots=True)
 class MutexLineData:
     """Typed representation of a single Mutex configuration line."""
@@ -21,8 +26,10 @@ class MutexLineData:
     fev: FEVMode = FEVMode.EMPTY
     is_net_regex: bool = False
     template: Optional[str] = None
-    mutexed_nets: tuple[str, ...] = field(default_factory=tuple)
-    active_nets: tuple[str, ...] = field(default_factory=tuple)
+    # Tuples are immutable, so a shared () default is safe and spares the
+    # generated __init__ a default_factory call per instance.
+    mutexed_nets: tuple[str, ...] = ()
+    active_nets: tuple[str, ...] = ()
 
     def net_specs(self) -> list[NetSpec]:
         """Return one spec per mutexed net for conflict detection."""
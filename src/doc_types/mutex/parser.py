@@ -6,8 +6,9 @@ Line format: mutex<N>[_suffix] <type> <nets> [on=<active>]
 from __future__ import annotations
 
 import re
+import sys
 
-from doc_types.mutex.line_data import MutexLineData, FEVMode
+from doc_types.mutex.line_data import FEV_BY_VALUE, MutexLineData
 
 
 COMMENT_INDICATOR = "#"
@@ -21,8 +22,11 @@ _MUTEX_LINE_RE = re.compile(
         r"(?:\s+(?P<is_regexp>regular|regexp)(?:_sch)?)"
     r")"
     r"\s+(?P<mutexed_nets>.+?)"
-    r"(?:\s+on=(?P<active_nets>.+))?$"
+    r"(?:\s+on=(?P<active_nets>.+))?$",
+    # Config files are ASCII: skip Unicode class tables for \d / \s.
+    re.ASCII,
 )
+_match_line = _MUTEX_LINE_RE.match
 
 
 def is_comment(text: str) -> bool:
@@ -33,6 +37,18 @@ def is_empty(text: str) -> bool:
     return not text.strip()
 
 
+_FEV_SUFFIXES = frozenset({"low", "high", "ignore"})
+# Type token -> (is_template, is_net_regex)
+_TYPE_TOKENS = {
+    "template": (True, False),
+    "template_sch": (True, False),
+    "regular": (False, False),
+    "regular_sch": (False, False),
+    "regexp": (False, True),
+    "regexp_sch": (False, True),
+}
+
+
 def parse(text: str) -> MutexLineData:
     """
     Parse a Mutex configuration line into a typed MutexLineData.
@@ -41,24 +57,87 @@ def parse(text: str) -> MutexLineData:
     Comments and blank lines should be checked by the caller first.
     """
     content = text.strip()
-    match = _MUTEX_LINE_RE.match(content)
+    # In printable ASCII the only whitespace is ' ', where str.split()
+    # and the regex's \s agree; anything else goes through the regex.
+    if content.isascii() and content.isprintable():
+        data = _parse_simple(content)
+        if data is not None:
+            return data
+
+    match = _match_line(content)
     if not match:
         raise ValueError("Line does not match the expected Mutex format")
 
-    active_str = match.group("active_nets")
+    is_regexp_group = match.group("is_regexp")
+    return _build(
+        match.group("mutex_num"),
+        match.group("fev_suffix") or "",
+        is_regexp_group is not None and is_regexp_group == "regexp",
+        match.group("template_name"),
+        match.group("mutexed_nets"),
+        match.group("active_nets"),
+    )
+
+
+def _parse_simple(content: str) -> MutexLineData | None:
+    """
+    Tokenize a space-separated line with str methods.
+
+    Returns ``None`` whenever the line is not in the plain form, leaving
+    the decision (and the error) to ``_MUTEX_LINE_RE``; any line it does
+    accept is parsed exactly as the regex would.
+    """
+    head, sep, rest = content.partition(" ")
+    if not sep or not head.startswith("mutex"):
+        return None
+    num, sep, fev_str = head[5:].partition("_")
+    if not num.isdigit() or (sep and fev_str not in _FEV_SUFFIXES):
+        return None
+
+    kind, sep, rest = rest.lstrip(" ").partition(" ")
+    flags = _TYPE_TOKENS.get(kind)
+    if flags is None or not sep:
+        return None
+    is_template, is_net_regex = flags
+    template = None
+    if is_template:
+        template, sep, rest = rest.lstrip(" ").partition(" ")
+        if not template or not sep:
+            return None
+
+    rest = rest.lstrip(" ")
+    if not rest:
+        return None
+    # The regex's lazy net group stops at the first " on=" that has a
+    # value after it.
+    on = rest.find(" on=")
+    if on >= 0 and on + 4 < len(rest):
+        return _build(num, fev_str, is_net_regex, template, rest[:on], rest[on + 4:])
+    return _build(num, fev_str, is_net_regex, template, rest, None)
+
+
+def _build(
+    num: str,
+    fev_str: str,
+    is_net_regex: bool,
+    template: str | None,
+    nets_text: str,
+    active_str: str | None,
+) -> MutexLineData:
+    # Net and template names recur across many lines of a document;
+    # interning keeps one string object per distinct name.  split()
+    # tokens carry no surrounding whitespace, so only the on= list needs
+    # stripping.
     active_nets = (
-        [n.strip() for n in active_str.split(",")]
+        tuple([sys.intern(n.strip()) for n in active_str.split(",")])
         if active_str
-        else []
+        else ()
     )
-
-    fev_str = match.group("fev_suffix") or ""
-    is_regexp_group = match.group("is_regexp")
     return MutexLineData(
-        num_active=int(match.group("mutex_num")),
-        fev=FEVMode(fev_str),
-        is_net_regex=is_regexp_group is not None and is_regexp_group == "regexp",
-        template=match.group("template_name") or None,
-        mutexed_nets=tuple(n.strip() for n in match.group("mutexed_nets").split()),
-        active_nets=tuple(active_nets),
+        num_active=int(num),
+        fev=FEV_BY_VALUE[fev_str],
+        is_net_regex=is_net_regex,
+        template=sys.intern(template) if template else None,
+        mutexed_nets=tuple(map(sys.intern, nets_text.split())),
+        active_nets=active_nets,
     )
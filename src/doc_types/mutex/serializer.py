@@ -6,33 +6,26 @@ JSON round-trip helpers (``from_dict`` / ``to_json``).
 """
 from __future__ import annotations
 
-import dataclasses
-
 from doc_types.mutex.line_data import MutexLineData, FEVMode
 
 
 def serialize(data: MutexLineData) -> str:
     """Serialize a MutexLineData into a single config line string."""
-    parts = [f"mutex{data.num_active}"]
-
     # FEV suffix (_low, _high, _ignore, or empty)
-    fev_suffix = data.fev.value
-    parts.append(f"_{fev_suffix}" if fev_suffix != FEVMode.EMPTY.value else "")
+    fev = data.fev.value
+    suffix = f"_{fev}" if fev else ""
 
     # Type: template or regexp/regular
     if data.template is not None:
-        parts.append(f" template {data.template}")
+        kind = f"template {data.template}"
     else:
-        parts.append(f" {'regexp' if data.is_net_regex else 'regular'}")
+        kind = "regexp" if data.is_net_regex else "regular"
 
-    # Mutexed nets (space-separated)
-    parts.append(" " + " ".join(data.mutexed_nets))
-
-    # Active nets (comma-separated with on=)
+    # Mutexed nets (space-separated), active nets (comma-separated with on=)
+    nets = " ".join(data.mutexed_nets)
     if data.active_nets:
-        parts.append(f" on={','.join(data.active_nets)}")
-
-    return "".join(parts)
+        return f"mutex{data.num_active}{suffix} {kind} {nets} on={','.join(data.active_nets)}"
+    return f"mutex{data.num_active}{suffix} {kind} {nets}"
 
 
 def from_dict(fields: dict) -> MutexLineData:
@@ -53,6 +46,13 @@ def from_dict(fields: dict) -> MutexLineData:
 
 def to_json(data: MutexLineData) -> dict:
     """Convert MutexLineData to a JSON-safe dict (FEV enum → string)."""
-    d = dataclasses.asdict(data)
-    d["fev"] = data.fev.value
-    return d
+    # The net tuples are immutable, so they are handed out as-is rather
+    # than deep-copied field by field as asdict() would.
+    return {
+        "num_active": data.num_active,
+        "fev": data.fev.value,
+        "is_net_regex": data.is_net_regex,
+        "template": data.template,
+        "mutexed_nets": data.mutexed_nets,
+        "active_nets": data.active_nets,
+    }
@@ -19,11 +19,23 @@ from contextlib import contextmanager
 
 class MutexEditSessionState:
 
+    __slots__ = ("session_id", "_mutexed", "_active", "_net_owner",
+                 "_mutexed_view", "_active_view",
+                 "_num_active", "_fev_mode", "_loading")
+
     def __init__(self, session_id: str):
         self.session_id = session_id
 
         self._mutexed: set[MutexEntry] = set()
         self._active: set[MutexEntry] = set()
+        # Resolved net -> the mutexed entry matching it.  Mutexed entries
+        # never intersect, so each net has at most one owner and a lookup
+        # here replaces scanning every entry's match set.
+        self._net_owner: dict[str, MutexEntry] = {}
+        # Frozen snapshots handed out by the *_entries properties; reset to
+        # None whenever the backing set changes and rebuilt on next access.
+        self._mutexed_view: frozenset[MutexEntry] | None = None
+        self._active_view: frozenset[MutexEntry] | None = None
         self._num_active: int = 1
         self._fev_mode: FEVMode = FEVMode.EMPTY
 
@@ -47,11 +59,17 @@ class MutexEditSessionState:
 
     @property
     def mutexed_entries(self) -> frozenset[MutexEntry]:
-        return frozenset(self._mutexed)
+        view = self._mutexed_view
+        if view is None:
+            view = self._mutexed_view = frozenset(self._mutexed)
+        return view
 
     @property
     def active_entries(self) -> frozenset[MutexEntry]:
-        return frozenset(self._active)
+        view = self._active_view
+        if view is None:
+            view = self._active_view = frozenset(self._active)
+        return view
 
     # ---------------------------
     # Configuration properties with invariants
@@ -73,13 +91,13 @@ class MutexEditSessionState:
     
     @property
     def num_active(self) -> int:
-        if self.active_entries:
-            return len(self.active_entries)
+        if self._active:
+            return len(self._active)
         return self._num_active
 
     @num_active.setter
     def num_active(self, value: int):
-        if self.active_entries:
+        if self._active:
             raise ValueError(
                 "Cannot set num_active when there are already active entries. "
                 "Clear active entries before setting num_active."
@@ -112,7 +130,7 @@ class MutexEditSessionState:
 
         # If this is the first entry, accept any template (including None)
         if not self._mutexed:
-            self._mutexed.add(entry)
+            self._add_mutexed(entry)
             return
 
         # After the first entry, require exact template match (including None)
@@ -131,13 +149,22 @@ class MutexEditSessionState:
                 f"which does not match session regex mode {self.regex_mode}."
             )
 
-        for existing in self._mutexed:
-            if entry.intersects(existing):
+        net_owner = self._net_owner
+        for net in entry.matches:
+            existing = net_owner.get(net)
+            if existing is not None:
                 raise IntersectionError(
                     f"Entry {entry} intersects with existing mutexed entry {existing}."
                 )
 
+        self._add_mutexed(entry)
+
+    def _add_mutexed(self, entry: MutexEntry) -> None:
         self._mutexed.add(entry)
+        self._mutexed_view = None
+        net_owner = self._net_owner
+        for net in entry.matches:
+            net_owner[net] = entry
 
     def add_active(self, entry: MutexEntry):
         if entry in self._active:
@@ -158,7 +185,7 @@ class MutexEditSessionState:
             )
 
         net = next(iter(entry.matches))
-        if not any(net in entry.matches for entry in self._mutexed): 
+        if net not in self._net_owner:
             if self.regex_mode:
                 raise EntryNotFoundError(
                     f"Net '{net}' is not covered by any mutexed pattern. "
@@ -166,6 +193,7 @@ class MutexEditSessionState:
                 )
             self.add_mutexed(entry)
         self._active.add(entry)
+        self._active_view = None
 
     def remove_mutexed(self, entry: MutexEntry):
         if entry not in self._mutexed:
@@ -174,14 +202,21 @@ class MutexEditSessionState:
         for active_entry in list(self._active):
             if entry.intersects(active_entry):
                 self._active.remove(active_entry)
+                self._active_view = None
 
         self._mutexed.remove(entry)
+        self._mutexed_view = None
+        net_owner = self._net_owner
+        for net in entry.matches:
+            if net_owner.get(net) is entry:
+                del net_owner[net]
 
     def remove_active(self, entry: MutexEntry):
         if entry not in self._active:
             raise EntryNotFoundError(f"Entry {entry} is not in the active set.")
 
         self._active.remove(entry)
+        self._active_view = None
 
     def validate(self) -> ValidationResult:
         """
@@ -191,7 +226,8 @@ class MutexEditSessionState:
         """
         errors = []
 
-        mutexed_net_count = sum(len(entry.matches) for entry in self._mutexed)
+        # Entries are disjoint, so this equals the sum of their match counts.
+        mutexed_net_count = len(self._net_owner)
         if mutexed_net_count < 2:
             errors.append(
                 f"At least 2 unique nets must be mutexed, "
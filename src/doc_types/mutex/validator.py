@@ -63,41 +63,49 @@ def validate(
         )
         return ValidationResult(errors=errors, warnings=warnings)
 
-    # Resolve all mutexed nets and count total matches
+    # Resolve all mutexed nets and count total matches.  The regex mode
+    # is per line, so it picks the loop once; NQS methods are bound once
+    # rather than looked up per net.
     all_matched_nets: set[str] = set()
-    for net in data.mutexed_nets:
-        if data.is_net_regex:
-            nets, _ = nqs.find_matches(template, net, False, True)
+    get_canonical = nqs.get_canonical_net_name
+    if data.is_net_regex:
+        find_matches = nqs.find_matches
+        for net in data.mutexed_nets:
+            nets, _ = find_matches(template, net, False, True)
             if not nets:
                 warnings.append(
                     f"No matches found for regex pattern '{net}'."
                 )
             all_matched_nets.update(nets)
-        elif nqs.has_bus_notation(net):
-            expanded = nqs.expand_bus_notation(net)
-            existing = [n for n in expanded if nqs.net_exists(n, template)]
-            if not existing:
-                warnings.append(
-                    f"Bus pattern '{net}' does not expand to any existing nets."
-                )
-            if len(existing) < len(expanded):
-                warnings.append(
-                    f"Bus notation '{net}' is larger than existing nets ({len(existing)}) in the netlist."
-                )
-            all_matched_nets.update(existing)
-        else:
-            canonical = nqs.get_canonical_net_name(net, template)
-            if canonical:
-                all_matched_nets.add(canonical)
-                if canonical != net:
+    else:
+        has_bus_notation = nqs.has_bus_notation
+        net_exists = nqs.net_exists
+        for net in data.mutexed_nets:
+            if has_bus_notation(net):
+                expanded = nqs.expand_bus_notation(net)
+                existing = [n for n in expanded if net_exists(n, template)]
+                if not existing:
+                    warnings.append(
+                        f"Bus pattern '{net}' does not expand to any existing nets."
+                    )
+                if len(existing) < len(expanded):
                     warnings.append(
-                        f"Provided net name '{net}' is not canonical, "
-                        f"please use '{canonical}' instead."
+                        f"Bus notation '{net}' is larger than existing nets ({len(existing)}) in the netlist."
                     )
+                all_matched_nets.update(existing)
             else:
-                warnings.append(
-                    f"Mutexed net '{net}' does not exist in the netlist."
-                )
+                canonical = get_canonical(net, template)
+                if canonical:
+                    all_matched_nets.add(canonical)
+                    if canonical != net:
+                        warnings.append(
+                            f"Provided net name '{net}' is not canonical, "
+                            f"please use '{canonical}' instead."
+                        )
+                else:
+                    warnings.append(
+                        f"Mutexed net '{net}' does not exist in the netlist."
+                    )
 
     # Not enough matched nets
     if len(all_matched_nets) < 2:
@@ -113,7 +121,7 @@ def validate(
 
     # Validate active nets
     for net in data.active_nets:
-        canonical = nqs.get_canonical_net_name(net, template)
+        canonical = get_canonical(net, template)
         if not canonical:
             warnings.append(
                 f"Active net '{net}' does not exist in the netlist."
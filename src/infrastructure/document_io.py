@@ -5,7 +5,7 @@ This is a functional module.  DocumentService will delegate here for
 the actual file ↔ Document conversion.
 
 Load flow:
-    file → readlines → for each line:
+    file → stream lines → for each line:
         is_comment?  → DocumentLine(COMMENT)
         is_empty?    → DocumentLine(EMPTY)
         parse(text)  → LineData → validate(data, nqs?) → DocumentLine(DATA)
@@ -15,7 +15,7 @@ Save flow:
     for each DocumentLine:
         DATA  → serializer.serialize(data)
         other → raw_text as-is
-    → write all to file
+    → stream each line to a temp file, then rename over the target
 """
 from __future__ import annotations
 
@@ -24,18 +24,17 @@ import logging
 import os
 import tempfile
 from pathlib import Path
-from typing import Optional, TYPE_CHECKING
+from typing import Any, Iterable, Optional, TextIO, TYPE_CHECKING
 
 logger = logging.getLogger(__name__)
 
 from core.document_type import DocumentType
 from core.document_line import DocumentLine
 from core.document import Document
-from core.validation_result import ValidationResult
-from core.line_status import LineStatus
+from core.validation_result import COMMENT_RESULT, OK_RESULT, ValidationResult
 
 import infrastructure.registrations  # noqa: F401  (side-effect: populates the registry)
-from infrastructure.registry import get_handler
+from infrastructure.registry import DocumentTypeHandler, get_handler
 
 if TYPE_CHECKING:
     from core.interfaces import INetlistQueryService
@@ -51,15 +50,20 @@ def _is_gz(path: Path) -> bool:
     return path.suffix == ".gz" or path.suffixes[-2:] == [".gz"]
 
 
-def _read_text(path: Path) -> str:
+def _open_text(path: Path) -> TextIO:
+    """Open *path* for line-by-line text reading, inflating if gzipped."""
     if _is_gz(path):
-        with gzip.open(path, "rt", encoding="utf-8") as f:
-            return f.read()
-    return path.read_text(encoding="utf-8")
+        return gzip.open(path, "rt", encoding="utf-8")
+    return path.open("r", encoding="utf-8")
 
 
-def _write_text(path: Path, content: str) -> None:
-    """Write *content* atomically: write to a temp file then rename."""
+def _write_lines(path: Path, lines: Iterable[str]) -> None:
+    """
+    Write *lines* atomically: write to a temp file then rename.
+
+    Each line is streamed through the file buffer with its newline, so
+    the output is never assembled into one string.
+    """
     if _is_gz(path):
         # gzip: write to temp, then atomic rename
         fd, tmp = tempfile.mkstemp(
@@ -68,7 +72,7 @@ def _write_text(path: Path, content: str) -> None:
         try:
             os.close(fd)
             with gzip.open(tmp, "wt", encoding="utf-8") as f:
-                f.write(content)
+                _write_each(f, lines)
             os.replace(tmp, str(path))
         except BaseException:
             with open(tmp, "w") as _:  # noqa: ensure file exists before unlink
@@ -81,7 +85,8 @@ def _write_text(path: Path, content: str) -> None:
         )
         try:
             os.close(fd)
-            Path(tmp).write_text(content, encoding="utf-8")
+            with open(tmp, "w", encoding="utf-8") as f:
+                _write_each(f, lines)
             os.replace(tmp, str(path))
         except BaseException:
             if os.path.exists(tmp):
@@ -89,6 +94,17 @@ def _write_text(path: Path, content: str) -> None:
             raise
 
 
+def _write_each(f: TextIO, lines: Iterable[str]) -> None:
+    write = f.write
+    line = None
+    for line in lines:
+        write(line)
+        write("\n")
+    if line is None:
+        # Match the old "\n".join(...) + "\n" output for an empty document.
+        write("\n")
+
+
 # ------------------------------------------------------------------
 # Parse a single raw text line into a DocumentLine
 # ------------------------------------------------------------------
@@ -111,20 +127,30 @@ def parse_line(
       ERROR   — could not parse, or parse raised ValueError
       OK / WARNING — successfully parsed; validator may add warnings
     """
-    handler = get_handler(doc_type)
+    return _parse_with(get_handler(doc_type), raw_text, nqs)
 
+
+def _parse_with(
+    handler: DocumentTypeHandler[Any],
+    raw_text: str,
+    nqs: Optional["INetlistQueryService"],
+) -> DocumentLine:
+    """``parse_line`` with the handler already resolved (bulk loads)."""
     stripped = raw_text.rstrip("\n\r")
 
-    if handler.is_empty(stripped):
+    # Same classification as handler.is_empty / is_comment, without two
+    # calls and two strip() passes per line.
+    lead = stripped.lstrip()
+    if not lead:
         return DocumentLine(
             raw_text=stripped,
-            validation_result=ValidationResult(status=LineStatus.OK),
+            validation_result=OK_RESULT,
         )
 
-    if handler.is_comment(stripped):
+    if lead.startswith(handler.comment_indicator):
         return DocumentLine(
             raw_text=stripped,
-            validation_result=ValidationResult(status=LineStatus.COMMENT),
+            validation_result=COMMENT_RESULT,
         )
 
     try:
@@ -132,7 +158,7 @@ def parse_line(
     except ValueError as exc:
         return DocumentLine(
             raw_text=stripped,
-            validation_result=ValidationResult(errors=[str(exc)]),
+            validation_result=ValidationResult.error([str(exc)]),
         )
 
     # Layer-2 domain validation (+ Layer-3 netlist if nqs provided)
@@ -163,9 +189,28 @@ def load_document(
     can fix them through the edit UI.
     """
     path = Path(file_path)
-    raw_lines = _read_text(path).splitlines(keepends=False)
-
-    doc_lines = [parse_line(line, doc_type, nqs) for line in raw_lines]
+    # Parse while reading: the file is never held in memory as one
+    # string plus a list of its lines.  parse_line strips the newline.
+    #
+    # Identical lines (blanks, repeated boilerplate) classify the same way
+    # within one load, so each distinct text is parsed and validated once
+    # and its immutable data / result are shared.  Every DocumentLine
+    # still gets its own line_id.
+    handler = get_handler(doc_type)
+    parsed: dict[str, DocumentLine] = {}
+    doc_lines: list[DocumentLine] = []
+    with _open_text(path) as f:
+        for raw in f:
+            first = parsed.get(raw)
+            if first is None:
+                first = parsed[raw] = _parse_with(handler, raw, nqs)
+                doc_lines.append(first)
+            else:
+                doc_lines.append(DocumentLine(
+                    raw_text=first.raw_text,
+                    data=first.data,
+                    validation_result=first.validation_result,
+                ))
 
     logger.info("Loaded %d lines from %s (type=%s)", len(doc_lines), path, doc_type.value)
     return Document(
@@ -197,12 +242,8 @@ def save_document(
 
     serialize = get_handler(document.doc_type).serialize
 
-    output_lines: list[str] = []
-    for line in document.lines:
-        if line.data is not None:
-            output_lines.append(serialize(line.data))
-        else:
-            output_lines.append(line.raw_text)
-
-    _write_text(target, "\n".join(output_lines) + "\n")
-    logger.info("Saved %d lines to %s", len(output_lines), target)
+    _write_lines(target, (
+        serialize(line.data) if line.data is not None else line.raw_text
+        for line in document
+    ))
+    logger.info("Saved %d lines to %s", len(document), target)
@@ -28,6 +28,7 @@ register(DocumentType.AF, DocumentTypeHandler(
     validate=af_validator.validate,
     from_dict=af_serializer.from_dict,
     to_json=af_serializer.to_json,
+    comment_indicator=af_parser.COMMENT_INDICATOR,
 ))
 
 # ---- Mutex ----
@@ -39,4 +40,5 @@ register(DocumentType.MUTEX, DocumentTypeHandler(
     validate=mutex_validator.validate,
     from_dict=mutex_serializer.from_dict,
     to_json=mutex_serializer.to_json,
+    comment_indicator=mutex_parser.COMMENT_INDICATOR,
 ))
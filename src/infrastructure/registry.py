@@ -38,6 +38,10 @@ class DocumentTypeHandler(Generic[T]):
     validate: Callable[[T, Optional["INetlistQueryService"]], "ValidationResult"]
     from_dict: Callable[[dict], T]
     to_json: Callable[[T], dict]
+    # Prefix that marks a comment line once leading whitespace is removed.
+    # ``parse_line`` classifies blank and comment lines with it directly
+    # (one strip, no calls) and must agree with ``is_empty``/``is_comment``.
+    comment_indicator: str = "#"
 
 
 _handlers: dict[DocumentType, DocumentTypeHandler[Any]] = {}
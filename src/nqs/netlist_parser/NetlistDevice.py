@@ -4,6 +4,8 @@ from __future__ import annotations
 
 class NetlistDevice:
 
+    __slots__ = ("_name", "_lower_name", "_connected_nets")
+
     pin_names = ['d', 'g', 's']
 
     def __init__(self, name, connected_nets):
@@ -8,6 +8,9 @@ if TYPE_CHECKING:
 
 class NetlistInstance:
 
+    __slots__ = ("_name", "_lower_name", "_template", "_parent_template",
+                 "_interface_connections", "_connected_nets")
+
     def __init__(self, name, template, connected_nets, parent_template):
         self._name = name
         self._lower_name = name.lower()
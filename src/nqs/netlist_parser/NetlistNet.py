@@ -2,6 +2,9 @@ from __future__ import annotations
 
 class NetlistNet:
 
+    __slots__ = ("_name", "_lower_name", "_is_interface", "_connected_sub_instances",
+                 "_connected_devices", "_connected_resistors")
+
     def __init__(self, name, is_interface=False):
         self._name = name
         self._lower_name = name.lower()
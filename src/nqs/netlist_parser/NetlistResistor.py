@@ -4,6 +4,8 @@ from __future__ import annotations
 
 class NetlistResistor:
 
+    __slots__ = ("_name", "_lower_name", "_connected_nets")
+
     pin_names = ['io1', 'io2']
 
     def __init__(self, name, connected_nets):
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import re
+import sys
+from collections.abc import Sequence
 from functools import lru_cache
 from typing import Optional, TYPE_CHECKING
 import logging
@@ -228,7 +230,7 @@ class NetlistQueryService:
         return matching_nets, matching_templates
 
     @lru_cache(maxsize=256)
-    def find_net_instance_names(self, template: str, net_name: str) -> set[str]:
+    def find_net_instance_names(self, template: str, net_name: str) -> frozenset[str]:
         """Find all instance names for a specific net in a template.
         
         Args:
@@ -236,17 +238,21 @@ class NetlistQueryService:
             net_name: Exact net name to find instances for
             
         Returns:
-            Set of instance names of the specified net
+            Frozenset of interned instance names of the specified net.
+            Immutable because the result is cached and shared by callers.
         """
         normalized_template = self._normalize_template_name(template)
         if normalized_template is None:
-            return set()
+            return frozenset()
 
         canonical_name = self._resolve_canonical_net_name(normalized_template, net_name.lower())
         if canonical_name is None:
-            return set()
+            return frozenset()
 
-        return set(self._netlist.get_net_instance_names(normalized_template, canonical_name))
+        return frozenset(map(
+            sys.intern,
+            self._netlist.get_net_instance_names(normalized_template, canonical_name),
+        ))
 
 ###########################################################################
 ############################ STATIC METHODS ##############################
@@ -415,22 +421,26 @@ class NetlistQueryService:
 ############################ PRIVATE METHODS ##############################
 ###########################################################################
 
-    def _get_matching_templates(self, template_name: str, template_regex: bool) -> list[str]:
+    @lru_cache(maxsize=256)
+    def _get_matching_templates(self, template_name: str, template_regex: bool) -> tuple[str, ...]:
         """
-        Get list of templates that match the given pattern.
+        Get the templates that match the given pattern.
         Uses in-memory set — no SQL needed (template count is always small).
+        Cached: a regex pattern is otherwise recompiled and run against
+        every template each time a line is revalidated.  The result is a
+        tuple because the cached value is shared by callers.
         """
         if not template_regex:
-            return [template_name] if template_name in self._all_templates else []
+            return (template_name,) if template_name in self._all_templates else ()
 
         try:
             pattern = re.compile(template_name, re.IGNORECASE)
-            return [t for t in self._all_templates if pattern.search(t)]
+            return tuple(t for t in self._all_templates if pattern.search(t))
         except re.error as e:
             logger.error(f"Error matching template pattern '{template_name}': {e}")
-            return []
+            return ()
 
-    def _get_matching_nets(self, templates: list[str], net_name: str, net_regex: bool) -> list[str]:
+    def _get_matching_nets(self, templates: Sequence[str], net_name: str, net_regex: bool) -> list[str]:
         """
         Get all matching nets across the given templates using a single SQL query.
         """
@@ -451,7 +461,7 @@ class NetlistQueryService:
         else:
             return self._match_nets_exact(templates, net_name)
 
-    def _match_nets_regex(self, templates: list[str], net_name: str) -> list[str]:
+    def _match_nets_regex(self, templates: Sequence[str], net_name: str) -> list[str]:
         """
         Match nets by regex pattern across all given templates in a single SQL query.
 
@@ -468,7 +478,7 @@ class NetlistQueryService:
             ) from e
         return self._format_net_results(results)
 
-    def _match_nets_bus(self, templates: list[str], net_name: str) -> list[str]:
+    def _match_nets_bus(self, templates: Sequence[str], net_name: str) -> list[str]:
         """
         Match nets by bus notation across all given templates in a single SQL query.
         """
@@ -490,7 +500,7 @@ class NetlistQueryService:
         results = self._db.match_bus(templates, expanded)
         return self._format_net_results(results)
 
-    def _match_nets_exact(self, templates: list[str], net_name: str) -> list[str]:
+    def _match_nets_exact(self, templates: Sequence[str], net_name: str) -> list[str]:
         """
         Match nets by exact name across all given templates in a single SQL query.
         """
@@ -528,7 +538,7 @@ class NetlistQueryService:
 
         return canonical_name.lower() if canonical_name is not None else None
 
-    def _get_matching_alias_nets(self, templates: list[str], net_name: str) -> set[str]:
+    def _get_matching_alias_nets(self, templates: Sequence[str], net_name: str) -> set[str]:
         if not templates or not net_name:
             return set()
 
@@ -576,6 +586,7 @@ class NetlistQueryService:
         self.net_exists.cache_clear()
         self.find_matches.cache_clear()
         self.find_net_instance_names.cache_clear()
+        self._get_matching_templates.cache_clear()
         self._resolve_canonical_net_name.cache_clear()
 
     def __enter__(self):
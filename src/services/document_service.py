@@ -17,9 +17,9 @@ import re
 from collections import Counter
 from typing import Any, Optional
 
-from core import DocumentType, Document, DocumentLine, HasNetSpecs, LineStatus, IEditController, INetlistQueryService, MutationRecord
+from core import DocumentType, Document, DocumentLine, HasNetSpecs, IEditController, INetlistQueryService, MutationRecord, SwapRecord
 from core.conflict_store import ConflictDetector
-from core.validation_result import ValidationResult
+from core.validation_result import COMMENT_RESULT, OK_RESULT
 from doc_types.af import AfEditController
 from doc_types.mutex import FEVMode, MutexEditController
 from infrastructure import load_document, save_document, parse_line
@@ -130,7 +130,7 @@ class DocumentService:
             pattern = None
 
         results: list[dict] = []
-        for pos, line in enumerate(doc.lines):
+        for pos, line in enumerate(doc):
             # Text filter
             if query:
                 if pattern is not None:
@@ -167,7 +167,7 @@ class DocumentService:
         line = doc[position]
         ctrl = self._controllers[doc.doc_type]
 
-        ctrl.start_session(line.line_id)
+        ctrl.start_session(str(line.line_id))
 
         if fields is not None:
             line_data = self._dict_to_line_data(doc.doc_type, fields)
@@ -242,17 +242,54 @@ class DocumentService:
         logger.info("Deleted line at pos=%d from doc=%s", position, doc_id)
         return self._document_summary(doc_id, doc)
 
+    def delete_lines(self, doc_id: str, positions: list[int]) -> dict:
+        """Delete several lines by 0-based position as one undo step.
+
+        Returns the updated summary.
+        """
+        doc = self._documents[doc_id]
+        line_ids = [doc[pos].line_id for pos in positions]
+
+        detector = self._conflict_detectors.get(doc_id)
+        if detector is not None:
+            for line_id in line_ids:
+                detector.remove_line(line_id)
+
+        doc.remove_lines(line_ids)
+        logger.info("Deleted %d lines from doc=%s", len(line_ids), doc_id)
+        return self._document_summary(doc_id, doc)
+
     def insert_blank_line(self, doc_id: str, position: int) -> dict:
         """Insert an empty line at *position*. Returns ``{"position": int}``."""
         doc = self._documents[doc_id]
         new_line = DocumentLine(
             raw_text="",
-            validation_result=ValidationResult(status=LineStatus.OK),
+            validation_result=OK_RESULT,
         )
         doc.insert_line(position, new_line)
         logger.debug("Inserted blank line at pos=%d in doc=%s", position, doc_id)
         return {"position": position}
 
+    def insert_blank_lines(self, doc_id: str, position: int, count: int) -> dict:
+        """Insert *count* empty lines at *position* as one undo step.
+
+        Returns ``{"position": int, "count": int}``.
+        """
+        if count < 1:
+            raise ValueError("count must be at least 1")
+        doc = self._documents[doc_id]
+        doc.insert_lines(position, [
+            DocumentLine(
+                raw_text="",
+                validation_result=OK_RESULT,
+            )
+            for _ in range(count)
+        ])
+        logger.debug(
+            "Inserted %d blank lines at pos=%d in doc=%s", count, position, doc_id,
+        )
+        return {"position": position, "count": count}
+
     # ------------------------------------------------------------------
     # Swap lines
     # ------------------------------------------------------------------
@@ -306,13 +343,10 @@ class DocumentService:
             leading_ws = old_line.raw_text[: len(old_line.raw_text) - len(old_line.raw_text.lstrip())]
             raw = leading_ws + raw
 
-            new_line = parse_line(raw, doc.doc_type, self._nqs)
             # Preserve the line_id so the undo replace works correctly
-            new_line = DocumentLine(
+            new_line = dataclasses.replace(
+                parse_line(raw, doc.doc_type, self._nqs),
                 line_id=old_line.line_id,
-                raw_text=new_line.raw_text,
-                data=new_line.data,
-                validation_result=new_line.validation_result,
             )
         else:
             # Comment — prepend '# ' to the raw text
@@ -320,7 +354,7 @@ class DocumentService:
             new_line = DocumentLine(
                 line_id=old_line.line_id,
                 raw_text=new_raw,
-                validation_result=ValidationResult(status=LineStatus.COMMENT),
+                validation_result=COMMENT_RESULT,
             )
 
         doc.replace_line(old_line.line_id, new_line)
@@ -361,7 +395,7 @@ class DocumentService:
         new_line = DocumentLine(
             line_id=old_line.line_id,
             raw_text=raw,
-            validation_result=ValidationResult(status=LineStatus.COMMENT),
+            validation_result=COMMENT_RESULT,
         )
         doc.replace_line(old_line.line_id, new_line)
 
@@ -477,10 +511,10 @@ class DocumentService:
 
     def _document_summary(self, doc_id: str, doc: Document) -> dict:
         detector = self._conflict_detectors.get(doc_id)
-        statuses = Counter(line.status.value for line in doc.lines)
+        statuses = Counter(line.status.value for line in doc)
         if detector:
             conflict_count = sum(
-                1 for line in doc.lines if detector.is_conflicting(line.line_id)
+                1 for line in doc if detector.is_conflicting(line.line_id)
             )
             if conflict_count:
                 statuses["conflict"] = conflict_count
@@ -563,7 +597,7 @@ class DocumentService:
         detector.rebuild(doc.lines)
 
     def _sync_conflicts_from_record(
-        self, doc_id: str, record: MutationRecord,
+        self, doc_id: str, record: MutationRecord | SwapRecord,
     ) -> None:
         """Update the conflict detector after an undo/redo mutation."""
         detector = self._conflict_detectors.get(doc_id)
@@ -573,12 +607,19 @@ class DocumentService:
             pass  # Swap changes no net content; conflict state is unaffected.
         elif record.kind == "remove":
             detector.remove_line(record.line_id)
+        elif record.kind == "remove_block":
+            for line in record.lines:
+                detector.remove_line(line.line_id)
+        elif record.kind == "insert_block":
+            for line in record.lines:
+                if line.data is not None:
+                    detector.update_line(line.line_id, line.data)
         else:  # insert or replace
             data = record.new_line.data if record.new_line else None
             detector.update_line(record.line_id, data)
 
     def _mutation_response(
-        self, doc_id: str, doc: Document, record: MutationRecord,
+        self, doc_id: str, doc: Document, record: MutationRecord | SwapRecord,
     ) -> dict:
         """Build the JSON response for an undo/redo operation."""
         detector = self._conflict_detectors.get(doc_id)
@@ -590,6 +631,8 @@ class DocumentService:
         }
         if record.kind == "swap":
             result["position2"] = record.position2
+        elif record.lines:
+            result["count"] = len(record.lines)
         elif record.kind != "remove":
             line = doc[record.position]
             result["line"] = self._serialize_line(
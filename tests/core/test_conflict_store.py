@@ -1,3 +1,6 @@
+import gc
+import weakref
+
 import pytest
 
 from core.conflict_store import ConflictStore, ConflictInfo, ConflictDetector
@@ -144,6 +147,18 @@ class TestConflictStoreUpdates:
         assert not store.is_conflicting("L1")
         assert store.get_conflict_info("L2") is None
 
+    def test_shared_net_cleared_when_last_peer_leaves(self):
+        store = ConflictStore()
+        store.update_line("L1", {"net100", "net200"})
+        store.update_line("L2", {"net100"})
+        store.update_line("L3", {"net100"})
+
+        store.remove_line("L2")
+        assert store.is_conflicting("L1")
+        store.update_line("L3", {"net300"})
+        assert not store.is_conflicting("L1")
+        assert store.get_conflicting_net_ids("L1") == frozenset()
+
     def test_remove_nonexistent_is_safe(self):
         store = ConflictStore()
         store.remove_line("nonexistent")  # no error
@@ -156,6 +171,28 @@ class TestConflictStoreUpdates:
         assert not store.is_conflicting("L1")
         assert not store.is_conflicting("L2")
 
+    def test_conflict_info_reused_until_mutation(self):
+        store = ConflictStore()
+        store.update_line("L1", {"net100"})
+        store.update_line("L2", {"net100"})
+
+        first = store.get_conflict_info("L1")
+        assert store.get_conflict_info("L1") is first
+
+        store.update_line("L3", {"net100"})
+        second = store.get_conflict_info("L1")
+        assert second is not first
+        assert second.conflicting_line_ids == {"L2", "L3"}
+
+    def test_conflict_info_invalidated_by_peer_removal(self):
+        store = ConflictStore()
+        store.update_line("L1", {"net100"})
+        store.update_line("L2", {"net100"})
+        assert store.get_conflict_info("L1") is not None
+
+        store.remove_line("L2")
+        assert store.get_conflict_info("L1") is None
+
 
 # ===========================================================
 # ConflictDetector
@@ -210,6 +247,14 @@ class TestConflictDetectorResolve:
         ids = det.resolve_to_canonical_names(None, "vdd", False, False)
         assert ids == frozenset({"vdd"})
 
+    def test_resolve_is_case_insensitive_and_cached(self):
+        nqs = _make_mock_nqs_for_detector()
+        det = ConflictDetector(nqs)
+
+        first = det.resolve_to_canonical_names(None, "VDD", False, False)
+        assert first == frozenset({"vdd"})
+        assert det.resolve_to_canonical_names(None, "vdd", False, False) is first
+
     def test_empty_net_returns_empty(self):
         nqs = _make_mock_nqs_for_detector()
         det = ConflictDetector(nqs)
@@ -220,6 +265,15 @@ class TestConflictDetectorResolve:
         det = ConflictDetector(nqs)
         assert det.resolve_to_canonical_names(None, "nonexistent", False, False) == frozenset()
 
+    def test_caches_do_not_keep_detector_alive(self):
+        nqs = _make_mock_nqs_for_detector()
+        det = ConflictDetector(nqs)
+        det.resolve_to_canonical_names(None, "vdd", False, False)
+        ref = weakref.ref(det)
+        del det
+        gc.collect()
+        assert ref() is None
+
 
 class TestConflictDetectorRebuild:
 
@@ -271,6 +325,62 @@ class TestConflictDetectorRebuild:
         assert not det.is_conflicting("L1")
         assert not det.is_conflicting("L2")
 
+    def test_rebuild_diff_keeps_unchanged_lines(self):
+        nqs = _make_mock_nqs_for_detector()
+        det = ConflictDetector(nqs)
+        det.rebuild([
+            _make_line("L1", AfLineData(net="vdd", af_value=0.5, is_em_enabled=True)),
+            _make_line("L2", AfLineData(net="vdd", af_value=0.8, is_em_enabled=True)),
+            _make_line("L3", AfLineData(net="clk", af_value=0.8, is_em_enabled=True)),
+        ])
+        l1_nets = det._store._line_nets["L1"]
+
+        det.rebuild_diff([
+            _make_line("L1", AfLineData(net="vdd", af_value=0.5, is_em_enabled=True)),
+            _make_line("L2", AfLineData(net="vss", af_value=0.8, is_em_enabled=True)),
+        ])
+        assert det._store._line_nets["L1"] is l1_nets
+        assert not det.is_conflicting("L1")
+        assert det.get_conflicting_lines("L3") == set()
+        assert "L3" not in det._store._line_nets
+
+    def test_rebuild_with_fresh_line_ids_batch_builds(self, monkeypatch):
+        nqs = _make_mock_nqs_for_detector()
+        det = ConflictDetector(nqs)
+        det.rebuild([
+            _make_line("L1", AfLineData(net="vdd", af_value=0.5, is_em_enabled=True)),
+        ])
+        built = []
+        build_from_lines = ConflictStore.build_from_lines
+
+        def spy(store, line_nets):
+            built.append(dict(line_nets))
+            build_from_lines(store, line_nets)
+
+        monkeypatch.setattr(ConflictStore, "build_from_lines", spy)
+        det.rebuild([
+            _make_line("L2", AfLineData(net="vdd", af_value=0.5, is_em_enabled=True)),
+        ])
+        assert built == [{"L2": frozenset({"vdd"})}]
+        assert "L1" not in det._store._line_nets
+        assert det._store._line_nets["L2"] == frozenset({"vdd"})
+
+    def test_rebuild_drops_cached_resolutions(self):
+        nqs = _make_mock_nqs_for_detector()
+        det = ConflictDetector(nqs)
+        lines = [
+            _make_line("L1", AfLineData(net="vdd", af_value=0.5, is_em_enabled=True)),
+            _make_line("L2", AfLineData(net="vss", af_value=0.5, is_em_enabled=True)),
+        ]
+        det.rebuild(lines)
+        assert not det.is_conflicting("L1")
+
+        # The netlist now maps vss onto the same top-cell net as vdd.
+        nqs.instance_names_map[("top", "vss")] = {"vdd"}
+        det.rebuild(lines)
+        assert det.is_conflicting("L1")
+        assert det.get_conflicting_lines("L1") == {"L2"}
+
     def test_rebuild_skips_comment_lines(self):
         nqs = _make_mock_nqs_for_detector()
         det = ConflictDetector(nqs)
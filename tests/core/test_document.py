@@ -29,6 +29,11 @@ class TestDocumentConstruction:
         doc = Document(DocumentType.MUTEX, file_path="/tmp/test.cfg")
         assert doc.file_path == "/tmp/test.cfg"
 
+    def test_default_line_ids_are_unique_ints(self):
+        a, b = DocumentLine(), DocumentLine()
+        assert isinstance(a.line_id, int)
+        assert a.line_id != b.line_id
+
 
 # ===========================================================
 # Read access
@@ -64,10 +69,22 @@ class TestDocumentRead:
         assert len(doc) == 3
 
     def test_lines_returns_immutable_view(self, doc):
-        """Returned tuple cannot mutate the document's internal state."""
+        """Returned view cannot mutate the document's internal state."""
         view = doc.lines
-        assert isinstance(view, tuple)
+        assert not hasattr(view, "__setitem__")
+        assert not hasattr(view, "append")
         assert len(view) == len(doc)
+        assert view[1].line_id == "bbb"
+        view[0:2].clear()  # slices are copies
+        assert len(doc) == 3
+
+    def test_lines_view_is_live(self, doc):
+        view = doc.lines
+        doc.remove_line("aaa")
+        assert [line.line_id for line in view] == ["bbb", "ccc"]
+
+    def test_iteration_yields_lines_in_order(self, doc):
+        assert list(doc) == list(doc.lines)
 
     def test_get_line_missing_raises(self, doc):
         with pytest.raises(KeyError):
@@ -101,6 +118,21 @@ class TestDocumentInsert:
         assert doc[1].line_id == "m"
         assert doc[2].line_id == "b"
 
+    def test_insert_past_end_appends_and_indexes(self):
+        doc = Document(DocumentType.AF, lines=[_make_line(line_id="a")])
+        doc.insert_line(5, _make_line(line_id="z"))
+        assert doc[1].line_id == "z"
+        assert doc.get_position("z") == 1
+        assert doc.undo().position == 1
+
+    def test_positions_exact_after_run_of_front_inserts(self):
+        doc = Document(DocumentType.AF, lines=[_make_line(line_id="a")])
+        for i in range(5):
+            doc.insert_line(0, _make_line(line_id=f"n{i}"))
+        doc.remove_line("n2")
+        assert [doc.get_position(l.line_id) for l in doc.lines] == list(range(5))
+        assert doc.get_line("a") is doc[4]
+
     def test_insert_duplicate_raises(self):
         doc = Document(DocumentType.AF, lines=[_make_line(line_id="a")])
         with pytest.raises(ValueError, match="Duplicate"):
@@ -126,6 +158,77 @@ class TestDocumentRemove:
             doc.remove_line("nope")
 
 
+class TestDocumentBlockMutations:
+
+    @pytest.fixture
+    def doc(self):
+        return Document(DocumentType.AF, lines=[
+            _make_line(line_id="a"),
+            _make_line(line_id="b"),
+            _make_line(line_id="c"),
+            _make_line(line_id="d"),
+        ])
+
+    def test_insert_lines_splices_block(self, doc):
+        doc.insert_lines(1, [_make_line(line_id="x"), _make_line(line_id="y")])
+        assert [line.line_id for line in doc.lines] == ["a", "x", "y", "b", "c", "d"]
+        assert doc.get_position("y") == 2
+        assert doc.get_position("d") == 5
+
+    def test_insert_lines_is_one_undo_step(self, doc):
+        doc.insert_lines(4, [_make_line(line_id="x"), _make_line(line_id="y")])
+        record = doc.undo()
+        assert record.kind == "remove_block"
+        assert [line.line_id for line in record.lines] == ["x", "y"]
+        assert len(doc) == 4
+        assert not doc.can_undo
+
+        record = doc.redo()
+        assert record.kind == "insert_block"
+        assert doc.get_position("y") == 5
+
+    def test_insert_lines_duplicate_raises_without_mutating(self, doc):
+        with pytest.raises(ValueError, match="Duplicate"):
+            doc.insert_lines(0, [_make_line(line_id="x"), _make_line(line_id="a")])
+        assert len(doc) == 4
+
+    def test_insert_lines_clamps_like_insert_line(self, doc):
+        doc.insert_lines(9, [_make_line(line_id="x")])
+        doc.insert_line(9, _make_line(line_id="y"))
+        doc.insert_lines(-99, [_make_line(line_id="z")])
+        doc.insert_lines(-1, [_make_line(line_id="w")])
+        assert [line.line_id for line in doc.lines] == [
+            "z", "a", "b", "c", "d", "x", "w", "y",
+        ]
+        assert doc.get_position("y") == 7
+
+    def test_insert_lines_undo_redo_uses_clamped_position(self, doc):
+        doc.insert_lines(9, [_make_line(line_id="x")])
+        assert doc.undo().position == 4
+        record = doc.redo()
+        assert record.position == 4
+        assert doc.get_position("x") == 4
+
+    def test_remove_lines_non_adjacent(self, doc):
+        removed = doc.remove_lines(["d", "b"])
+        assert [line.line_id for line in removed] == ["b", "d"]
+        assert [line.line_id for line in doc.lines] == ["a", "c"]
+        assert doc.get_position("c") == 1
+
+    def test_undo_remove_lines_restores_positions(self, doc):
+        doc.remove_lines(["b", "d"])
+        record = doc.undo()
+        assert record.kind == "insert_block"
+        assert record.position == 1
+        assert [line.line_id for line in doc.lines] == ["a", "b", "c", "d"]
+        assert doc.get_position("d") == 3
+
+    def test_remove_lines_unknown_id_raises_without_mutating(self, doc):
+        with pytest.raises(KeyError):
+            doc.remove_lines(["a", "zzz"])
+        assert len(doc) == 4
+
+
 class TestDocumentReplace:
 
     def test_replace_same_id(self):
@@ -174,6 +277,15 @@ class TestUndoRedoProperties:
         doc = Document(DocumentType.AF)
         assert doc.redo() is None
 
+    def test_undo_history_is_capped(self):
+        doc = Document(DocumentType.AF, undo_limit=2)
+        for i, line_id in enumerate("abc"):
+            doc.insert_line(i, _make_line(line_id=line_id))
+        assert doc.undo().line_id == "c"
+        assert doc.undo().line_id == "b"
+        assert doc.undo() is None
+        assert doc.has_line("a")
+
     def test_new_mutation_clears_redo_stack(self):
         doc = Document(DocumentType.AF, lines=[
             _make_line(line_id="a", raw_text="original"),
@@ -187,6 +299,33 @@ class TestUndoRedoProperties:
         assert not doc.can_redo
 
 
+class TestCommandPooling:
+
+    def test_discarded_redo_commands_are_reused(self):
+        doc = Document(DocumentType.AF, lines=[_make_line(line_id="a")])
+        doc.insert_line(1, _make_line(line_id="b"))
+        doc.undo()
+        discarded = doc._redo_stack[-1]
+
+        # A new mutation discards the redo history into the pool...
+        doc.insert_line(1, _make_line(line_id="c"))
+        assert discarded._line is None
+        # ...and the next insert picks the pooled instance back up.
+        doc.insert_line(2, _make_line(line_id="d"))
+        assert doc._undo_stack[-1] is discarded
+        doc.undo()
+        assert not doc.has_line("d")
+
+    def test_commands_evicted_by_undo_limit_are_released(self):
+        doc = Document(DocumentType.AF, undo_limit=2)
+        doc.insert_line(0, _make_line(line_id="a"))
+        oldest = doc._undo_stack[0]
+        doc.insert_line(1, _make_line(line_id="b"))
+        doc.insert_line(2, _make_line(line_id="c"))
+        assert oldest not in doc._undo_stack
+        assert oldest._line is None
+
+
 class TestUndoInsert:
 
     def test_undo_insert_removes_line(self):
@@ -406,3 +545,10 @@ class TestSwapLines:
         record = doc.undo()
         assert record.position == 0
         assert record.position2 == 2
+
+    def test_swap_records_line_at_first_position_before_replay(self, doc):
+        doc.swap_lines(2, 0)
+        undo_record = doc.undo()
+        assert (undo_record.position, undo_record.position2) == (0, 2)
+        assert undo_record.line_id == "a"
+        assert doc.redo().line_id == "c"
@@ -0,0 +1,31 @@
+import pytest
+
+from core.line_status import LineStatus
+from core.validation_result import ValidationResult
+
+
+# ===========================================================
+# Fast-path constructors
+# ===========================================================
+
+class TestFastConstructors:
+
+    def test_error_matches_constructor(self):
+        result = ValidationResult.error(["bad"], ["meh"])
+        assert result == ValidationResult(errors=["bad"], warnings=["meh"])
+        assert result.status == LineStatus.ERROR
+        assert not result.is_valid
+
+    def test_warning_matches_constructor(self):
+        result = ValidationResult.warning(["meh"])
+        assert result == ValidationResult(warnings=["meh"])
+        assert result.status == LineStatus.WARNING
+        assert result.is_valid
+
+    def test_error_without_errors_is_rejected(self):
+        with pytest.raises(ValueError):
+            ValidationResult.error([])
+
+    def test_warning_without_warnings_is_rejected(self):
+        with pytest.raises(ValueError):
+            ValidationResult.warning(())
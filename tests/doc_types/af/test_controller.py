@@ -83,7 +83,7 @@ class TestAfControllerValidateErrors:
         ctrl.set_sh_mode(False)
         result = ctrl.validate()
         assert result
-        assert result.warnings == []
+        assert not result.warnings
 
 
 # ===========================================================
@@ -113,7 +113,7 @@ class TestAfControllerValidateWarnings:
         ctrl.set_sh_mode(False)
         result = ctrl.validate()
         assert result.is_valid
-        assert result.warnings == []
+        assert not result.warnings
 
     def test_warnings_skipped_when_session_invalid(self, ctrl, nqs):
         # Session invalid (no net) → service check not attempted
@@ -123,7 +123,7 @@ class TestAfControllerValidateWarnings:
         ctrl.set_sh_mode(False)
         result = ctrl.validate()
         assert not result.is_valid
-        assert result.warnings == []
+        assert not result.warnings
 
 
 # ===========================================================
@@ -1,3 +1,7 @@
+import dataclasses
+import inspect
+import re
+
 import pytest
 
 from doc_types.af import AfLineData, parser as af_parser
@@ -74,6 +78,19 @@ class TestAfParserSuccess:
         data = af_parser.parse("{vdd} 1 net-regular_em")
         assert data.af_value == 1.0
 
+    def test_parsed_data_is_immutable(self):
+        data = af_parser.parse("{vdd} 0.5 net-regular_em")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            data.net = "gnd"
+        assert data == AfLineData(net="vdd", af_value=0.5, is_em_enabled=True)
+        assert hash(data) == hash(AfLineData(net="vdd", af_value=0.5, is_em_enabled=True))
+
+    def test_init_signature_matches_fields(self):
+        params = inspect.signature(AfLineData).parameters
+        fields = dataclasses.fields(AfLineData)
+        assert list(params) == [f.name for f in fields]
+        assert [p.default for p in params.values()] == [f.default for f in fields]
+
     def test_bus_notation_in_net(self):
         data = af_parser.parse("{T1:net[0:3]} 0.5 net-regular_template-regular_em")
         assert data.template == "T1"
@@ -125,3 +142,28 @@ class TestAfParserErrors:
     def test_template_mode_missing_colon(self):
         with pytest.raises(ValueError, match="exactly one ':'"):
             af_parser.parse("{vdd} 0.5 net-regular_template-regular_em")
+
+
+# ===========================================================
+# Bus stripping
+# ===========================================================
+
+# The regex _strip_bus replaced, kept here as its reference spec.
+_BUS_RE = re.compile(r"\[\d+[:\-]\d+\]")
+
+
+class TestStripBus:
+
+    def test_matches_reference_regex(self):
+        samples = [
+            "", "net", "net[0:3]", "T:net[0-3]", "a[1:2]b[3:4]c",
+            "T:n[0]", "T:n[a:b]", "T:n[1:2-3]", "[[1:2]", "n[1:2]]",
+            "n[:2]", "n[1:]", "n[12:34", "x[1:2][3-4]:y",
+        ]
+        for s in samples:
+            assert af_parser._strip_bus(s) == _BUS_RE.sub("", s), s
+
+    def test_bus_colon_is_ignored_in_template_mode(self):
+        data = af_parser.parse("{T1:bus[7-0]} 0.5 net-regular_template-regular_em")
+        assert data.template == "T1"
+        assert data.net == "bus[7-0]"
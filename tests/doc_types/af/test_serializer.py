@@ -1,3 +1,5 @@
+import dataclasses
+
 import pytest
 
 from doc_types.af import AfLineData, serializer as af_serializer, parser as af_parser
@@ -50,6 +52,10 @@ class TestAfSerializer:
         with pytest.raises(ValueError, match="net is required"):
             af_serializer.serialize(AfLineData())
 
+    def test_empty_template_serializes_as_no_template(self):
+        data = AfLineData(template="", net="vdd", af_value=0.5, is_em_enabled=True)
+        assert af_serializer.serialize(data) == "{vdd} 0.5 net-regular_em"
+
 
 # ===========================================================
 # Round-trip: parse → serialize → parse
@@ -69,3 +75,9 @@ class TestAfRoundTrip:
         serialized = af_serializer.serialize(data)
         reparsed = af_parser.parse(serialized)
         assert data == reparsed
+
+    def test_json_round_trip(self):
+        data = af_parser.parse("{T1:vdd} 0.8 net-regexp_template-regular_sch_em")
+        payload = af_serializer.to_json(data)
+        assert payload == dataclasses.asdict(data)
+        assert af_serializer.from_dict(payload) == data
@@ -2,6 +2,7 @@ import pytest
 
 from doc_types.af import AfLineData, validator
 from core import ValidationResult
+from core.validation_result import OK_RESULT
 from tests.mock_nqs import MockNetlistQueryService
 
 
@@ -15,7 +16,11 @@ class TestAfValidatorDomain:
         data = AfLineData(net="vdd", af_value=0.5, is_em_enabled=True)
         result = validator.validate(data)
         assert result.is_valid
-        assert result.errors == []
+        assert not result.errors
+
+    def test_valid_data_returns_shared_result(self):
+        data = AfLineData(net="vdd", af_value=0.5, is_em_enabled=True)
+        assert validator.validate(data) is OK_RESULT
 
     def test_empty_net(self):
         data = AfLineData(af_value=0.5, is_em_enabled=True)
@@ -73,7 +78,7 @@ class TestAfValidatorNetlist:
         data = AfLineData(net="vdd", af_value=0.5, is_em_enabled=True)
         result = validator.validate(data, nqs=nqs)
         assert result.is_valid
-        assert result.warnings == []
+        assert not result.warnings
 
     def test_no_matches_warning(self, nqs):
         data = AfLineData(net="nonexistent", af_value=0.5, is_em_enabled=True)
@@ -98,12 +103,25 @@ class TestAfValidatorNetlist:
         assert result.is_valid
         assert any("does not exist" in w.lower() for w in result.warnings)
 
+    def test_matched_template_is_not_looked_up_again(self, nqs):
+        def fail(*args):
+            raise AssertionError("get_matching_templates should not be called")
+        nqs.get_matching_templates = fail
+        data = AfLineData(template="T1", net="vdd", af_value=0.5, is_em_enabled=True)
+        assert validator.validate(data, nqs=nqs).is_valid
+
+    def test_missing_net_in_existing_template_warning(self, nqs):
+        data = AfLineData(template="T1", net="gnd", af_value=0.5, is_em_enabled=True)
+        result = validator.validate(data, nqs=nqs)
+        assert result.is_valid
+        assert any("no matches" in w.lower() for w in result.warnings)
+
     def test_domain_errors_skip_netlist(self, nqs):
         """When domain errors exist, netlist checks are skipped."""
         data = AfLineData(net="", af_value=0.5, is_em_enabled=True)
         result = validator.validate(data, nqs=nqs)
         assert not result.is_valid
-        assert result.warnings == []  # no netlist warnings attempted
+        assert not result.warnings  # no netlist warnings attempted
 
     def test_bus_width_warning(self, nqs):
         # net[0:3] expands to 4 bits, but only 2 match
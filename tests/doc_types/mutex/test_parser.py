@@ -64,6 +64,16 @@ class TestMutexParserSuccess:
         assert data.num_active == 5
         assert len(data.mutexed_nets) == 5
 
+    def test_tab_separated_matches_space_separated(self):
+        spaced = mutex_parser.parse("mutex2_low template_sch T1 net1 net2 on=net1")
+        tabbed = mutex_parser.parse("mutex2_low\ttemplate_sch\tT1\tnet1\tnet2\ton=net1")
+        assert tabbed == spaced
+
+    def test_empty_on_is_a_net(self):
+        data = mutex_parser.parse("mutex1 regular net1 on=")
+        assert data.mutexed_nets == ("net1", "on=")
+        assert data.active_nets == ()
+
 
 # ===========================================================
 # Parse errors
@@ -78,3 +88,7 @@ class TestMutexParserErrors:
     def test_missing_nets(self):
         with pytest.raises(ValueError, match="does not match"):
             mutex_parser.parse("mutex2 regular")
+
+    def test_unknown_fev_suffix(self):
+        with pytest.raises(ValueError, match="does not match"):
+            mutex_parser.parse("mutex2_medium regular net1 net2")
@@ -1,3 +1,5 @@
+import json
+
 import pytest
 
 from doc_types.mutex import MutexLineData, FEVMode, serializer as mutex_serializer, parser as mutex_parser
@@ -62,3 +64,10 @@ class TestMutexRoundTrip:
         serialized = mutex_serializer.serialize(data)
         reparsed = mutex_parser.parse(serialized)
         assert data == reparsed
+
+    def test_json_round_trip(self):
+        data = mutex_parser.parse("mutex1_high template T1 net1 net2 on=net2")
+        payload = mutex_serializer.to_json(data)
+        assert payload["fev"] == "high"
+        assert json.loads(json.dumps(payload))["mutexed_nets"] == ["net1", "net2"]
+        assert mutex_serializer.from_dict(payload) == data
@@ -171,6 +171,25 @@ class TestIntersection:
         # e2 should NOT have been added as a separate mutexed entry
         assert len(session.mutexed_entries) == 1
 
+    def test_intersection_error_names_existing_entry(self):
+        session = MutexEditSessionState("s1")
+        e1 = make_entry("net1", matches={"net1"})
+        e2 = make_entry("net2", matches={"net2", "net3"})
+        e3 = make_entry("net3", matches={"net3", "net4"})
+        session.add_mutexed(e1)
+        session.add_mutexed(e2)
+        with pytest.raises(IntersectionError, match="existing mutexed entry .*net2"):
+            session.add_mutexed(e3)
+
+    def test_nets_free_again_after_remove(self):
+        session = MutexEditSessionState("s1")
+        e1 = make_entry("net1", matches={"net1", "net2"})
+        e2 = make_entry("net2", matches={"net2", "net3"})
+        session.add_mutexed(e1)
+        session.remove_mutexed(e1)
+        session.add_mutexed(e2)
+        assert session.mutexed_entries == frozenset({e2})
+
 
 # ===========================================================
 # Remove
@@ -218,6 +237,37 @@ class TestRemove:
             session.remove_active(e1)
 
 
+# ===========================================================
+# Entry views
+# ===========================================================
+
+class TestEntryViews:
+
+    def test_views_are_reused_between_mutations(self):
+        session = MutexEditSessionState("s1")
+        session.add_active(make_entry("net1"))
+        assert session.mutexed_entries is session.mutexed_entries
+        assert session.active_entries is session.active_entries
+
+    def test_views_reflect_mutations(self):
+        session = MutexEditSessionState("s1")
+        e1 = make_entry("net1")
+        e2 = make_entry("net2")
+        session.add_active(e1)
+        mutexed_before = session.mutexed_entries
+        active_before = session.active_entries
+        session.add_active(e2)
+        assert session.mutexed_entries == frozenset({e1, e2})
+        assert session.active_entries == frozenset({e1, e2})
+        assert mutexed_before == frozenset({e1})
+        assert active_before == frozenset({e1})
+        session.remove_active(e2)
+        assert session.active_entries == frozenset({e1})
+        session.remove_mutexed(e1)
+        assert session.mutexed_entries == frozenset({e2})
+        assert session.active_entries == frozenset()
+
+
 # ===========================================================
 # Empty session
 # ===========================================================
@@ -11,6 +11,7 @@ from core import DocumentType, LineStatus
 from doc_types.af import AfLineData
 from doc_types.mutex import MutexLineData
 from infrastructure import parse_line, load_document, save_document
+from infrastructure.registry import get_handler
 
 
 # ===========================================================
@@ -32,6 +33,14 @@ class TestParseLineAf:
         line = parse_line("   ", DocumentType.AF)
         assert line.status == LineStatus.OK
 
+    def test_message_free_results_are_shared(self):
+        first = parse_line("# a", DocumentType.AF).validation_result
+        second = parse_line("# b", DocumentType.AF).validation_result
+        assert first is second
+        assert parse_line("", DocumentType.AF).validation_result is parse_line(
+            " ", DocumentType.AF,
+        ).validation_result
+
     def test_valid_data(self):
         line = parse_line("{vdd} 0.5 net-regular_em_sh", DocumentType.AF)
         assert line.status == LineStatus.OK
@@ -73,6 +82,22 @@ class TestParseLineMutex:
         assert line.validation_result.errors
 
 
+# ===========================================================
+# parse_line — classification agrees with the handlers
+# ===========================================================
+
+class TestParseLineClassification:
+
+    @pytest.mark.parametrize("doc_type", list(DocumentType))
+    @pytest.mark.parametrize("text", ["", "   ", "\t", "# c", "  # c", "\t#", "x # c", "#"])
+    def test_matches_handler_predicates(self, doc_type, text):
+        handler = get_handler(doc_type)
+        status = parse_line(text, doc_type).status
+        assert (status == LineStatus.COMMENT) == handler.is_comment(text)
+        if handler.is_empty(text):
+            assert status == LineStatus.OK
+
+
 # ===========================================================
 # load_document — AF file
 # ===========================================================
@@ -104,6 +129,22 @@ class TestLoadDocumentAf:
         assert doc[0].raw_text == "garbage line"
         assert doc[1].status == LineStatus.OK
 
+    def test_repeated_lines_share_parse_but_not_ids(self, tmp_path):
+        cfg = tmp_path / "dup.af"
+        cfg.write_text("{vdd} 0.5 net-regular_em\n" * 3)
+        doc = load_document(cfg, DocumentType.AF)
+        assert len({line.line_id for line in doc}) == 3
+        assert doc[0].data is doc[1].data is doc[2].data
+        assert all(line.status == LineStatus.OK for line in doc)
+
+    def test_load_crlf_and_missing_final_newline(self, tmp_path):
+        cfg = tmp_path / "crlf.af"
+        cfg.write_bytes(b"# header\r\n{vdd} 0.5 net-regular_em\r\n{gnd} 0.8 net-regular_sh")
+        doc = load_document(cfg, DocumentType.AF)
+        assert [line.raw_text for line in doc] == [
+            "# header", "{vdd} 0.5 net-regular_em", "{gnd} 0.8 net-regular_sh",
+        ]
+
 
 # ===========================================================
 # load_document — Mutex file
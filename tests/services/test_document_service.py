@@ -399,6 +399,25 @@ class TestDeleteLine:
             os.unlink(path)
 
 
+    def test_delete_lines_is_one_undo_step(self, svc: DocumentService):
+        content = "{in1} 0.5 net-regular_em_sh\n# c\n{in1} 0.7 net-regular_em_sh\n"
+        path = _write_tmp(content)
+        try:
+            svc.load("d1", path, DocumentType.AF)
+            svc.delete_lines("d1", [0, 2])
+            assert [l["raw_text"] for l in svc.get_lines("d1")] == ["# c"]
+
+            result = svc.undo("d1")
+            assert result["action"] == "insert_block"
+            assert result["count"] == 2
+            lines = svc.get_lines("d1")
+            assert len(lines) == 3
+            # Conflict between the restored lines is tracked again
+            assert lines[0]["is_conflict"] and lines[2]["is_conflict"]
+        finally:
+            os.unlink(path)
+
+
 # ==================================================================
 # Insert blank line
 # ==================================================================
@@ -448,6 +467,19 @@ class TestInsertBlankLine:
             os.unlink(path)
 
 
+    def test_insert_blank_lines_block(self, svc: DocumentService):
+        path = _write_tmp(AF_LINES)
+        try:
+            svc.load("d1", path, DocumentType.AF)
+            before = len(svc.get_lines("d1"))
+            assert svc.insert_blank_lines("d1", 1, 3) == {"position": 1, "count": 3}
+            assert len(svc.get_lines("d1")) == before + 3
+            svc.undo("d1")
+            assert len(svc.get_lines("d1")) == before
+        finally:
+            os.unlink(path)
+
+
 # ==================================================================
 # Undo / Redo (integration through DocumentService)
 # ==================================================================
@@ -252,20 +252,17 @@ class TestConflictDetectorIntegration:
     def test_hierarchy_cache_populated(self, nqs):
         """Verify the unbounded hierarchy cache is populated after resolution."""
         det = ConflictDetector(nqs)
-        info_before = det._resolve_tpl_net_to_top_names.cache_info()
+        assert not det._top_names
 
         det.resolve_to_canonical_names("d", "n3", False, False)
-        info_after = det._resolve_tpl_net_to_top_names.cache_info()
-        assert info_after.currsize > info_before.currsize
+        assert ("d", "n3") in det._top_names
 
-    def test_repeated_calls_hit_cache(self, nqs):
+    def test_repeated_calls_hit_cache(self, nqs, monkeypatch):
         """Second call should hit the hierarchy cache."""
         det = ConflictDetector(nqs)
         det.resolve_to_canonical_names("d", "n3", False, False)
-        info1 = det._resolve_tpl_net_to_top_names.cache_info()
 
         # Clear the outer resolve cache so it re-enters the method
-        det.resolve_to_canonical_names.cache_clear()
-        det.resolve_to_canonical_names("d", "n3", False, False)
-        info2 = det._resolve_tpl_net_to_top_names.cache_info()
-        assert info2.hits > info1.hits
+        det._resolved.clear()
+        monkeypatch.setattr(det._nqs, "find_net_instance_names", None)
+        assert det.resolve_to_canonical_names("d", "n3", False, False)